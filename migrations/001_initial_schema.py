@@ -9,7 +9,7 @@ from nova.db.base import Base
 from nova.db.engine import get_db_engine
 from nova.tools.mcp.mcp_registry import MCPServerConfig
 from nova.tools.core.specialist_registry import SpecialistConfig
-from nova.tools.scheduler.scheduler.scheduler import ScheduledTask
+from nova.tools.scheduler.scheduler import ScheduledTask
 
 
 def run_migrations():
@@ -59,32 +59,62 @@ def run_migrations():
     # 3. Schema updates (column additions)
     # Check for team_members in scheduled_tasks
     if "scheduled_tasks" in tables:
-        columns = [c["name"] for c in inspector.get_columns("scheduled_tasks")]
-        if "team_members" not in columns:
-            print("Adding 'team_members' column to 'scheduled_tasks'...")
+        if engine.dialect.name == "postgresql":
+            # Idempotent DDL, no catalog round-trip to check for the columns first
             try:
                 with engine.begin() as conn:
-                    # SQLite doesn't support JSON type in old versions, but modern ones do via text or JSON
                     conn.execute(
-                        text("ALTER TABLE scheduled_tasks ADD COLUMN team_members JSON")
+                        text(
+                            "ALTER TABLE scheduled_tasks "
+                            "ADD COLUMN IF NOT EXISTS team_members JSONB"
+                        )
                     )
-                print("Added 'team_members' column.")
-            except Exception as e:
-                print(f"Failed to add team_members column: {e}")
-
-        if "status" not in columns:
-            print("Adding 'status' column to 'scheduled_tasks'...")
-            try:
-                with engine.begin() as conn:
-                    # Default is ACTIVE
                     conn.execute(
                         text(
-                            "ALTER TABLE scheduled_tasks ADD COLUMN status VARCHAR(20) DEFAULT 'active'"
+                            "ALTER TABLE scheduled_tasks "
+                            "ADD COLUMN IF NOT EXISTS status VARCHAR(20) DEFAULT 'active'"
+                        )
+                    )
+                    # Timestamps are filled in by the database
+                    conn.execute(
+                        text(
+                            "ALTER TABLE scheduled_tasks "
+                            "ALTER COLUMN created_at SET DEFAULT now(), "
+                            "ALTER COLUMN updated_at SET DEFAULT now()"
                         )
                     )
-                print("Added 'status' column.")
             except Exception as e:
-                print(f"Failed to add status column: {e}")
+                print(f"Failed to add scheduled_tasks columns: {e}")
+        else:
+            # SQLite has no ADD COLUMN IF NOT EXISTS
+            columns = [c["name"] for c in inspector.get_columns("scheduled_tasks")]
+            if "team_members" not in columns:
+                print("Adding 'team_members' column to 'scheduled_tasks'...")
+                try:
+                    with engine.begin() as conn:
+                        # SQLite doesn't support JSON type in old versions, but modern ones do via text or JSON
+                        conn.execute(
+                            text(
+                                "ALTER TABLE scheduled_tasks ADD COLUMN team_members JSON"
+                            )
+                        )
+                    print("Added 'team_members' column.")
+                except Exception as e:
+                    print(f"Failed to add team_members column: {e}")
+
+            if "status" not in columns:
+                print("Adding 'status' column to 'scheduled_tasks'...")
+                try:
+                    with engine.begin() as conn:
+                        # Default is ACTIVE
+                        conn.execute(
+                            text(
+                                "ALTER TABLE scheduled_tasks ADD COLUMN status VARCHAR(20) DEFAULT 'active'"
+                            )
+                        )
+                    print("Added 'status' column.")
+                except Exception as e:
+                    print(f"Failed to add status column: {e}")
 
         # Update TaskType ENUM for Postgres if needed
         try:
@@ -98,6 +128,55 @@ def run_migrations():
         except Exception as e:
             print(f"ENUM update note (might already exist): {e}")
 
+    # Convert JSON config columns to native JSONB on Postgres
+    if engine.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import JSONB
+
+        for table, column in (
+            ("nova_mcp_servers", "args"),
+            ("nova_mcp_servers", "env"),
+            ("scheduled_tasks", "team_members"),
+        ):
+            if table not in tables:
+                continue
+            col_types = {c["name"]: c["type"] for c in inspector.get_columns(table)}
+            if column not in col_types or isinstance(col_types[column], JSONB):
+                continue
+            print(f"Converting '{table}.{column}' to JSONB...")
+            try:
+                with engine.begin() as conn:
+                    conn.execute(
+                        text(
+                            f"ALTER TABLE {table} ALTER COLUMN {column} "
+                            f"TYPE JSONB USING {column}::jsonb"
+                        )
+                    )
+                print(f"Converted '{table}.{column}' to JSONB.")
+            except Exception as e:
+                print(f"Failed to convert {table}.{column} to JSONB: {e}")
+
+    # Database-stamped scheduled_tasks timestamps are timestamptz on Postgres;
+    # older rows were written with datetime.utcnow, so read them as UTC
+    if engine.dialect.name == "postgresql" and "scheduled_tasks" in tables:
+        col_types = {
+            c["name"]: c["type"] for c in inspector.get_columns("scheduled_tasks")
+        }
+        for column in ("created_at", "updated_at"):
+            if column not in col_types or getattr(col_types[column], "timezone", False):
+                continue
+            print(f"Converting 'scheduled_tasks.{column}' to TIMESTAMPTZ...")
+            try:
+                with engine.begin() as conn:
+                    conn.execute(
+                        text(
+                            f"ALTER TABLE scheduled_tasks ALTER COLUMN {column} "
+                            f"TYPE TIMESTAMPTZ USING {column} AT TIME ZONE 'UTC'"
+                        )
+                    )
+                print(f"Converted 'scheduled_tasks.{column}' to TIMESTAMPTZ.")
+            except Exception as e:
+                print(f"Failed to convert scheduled_tasks.{column} to TIMESTAMPTZ: {e}")
+
     # 4. Add deployment_pending column to active_tasks if not exists
     # (for tracking when deployment should wait for task)
     if "active_tasks" in tables:
@@ -134,6 +213,35 @@ def run_migrations():
                 except Exception:
                     pass
 
+            # Partial index for the active project lookup
+            if "project_contexts" in tables:
+                include = (
+                    " INCLUDE (name, absolute_path, git_remote, metadata_json)"
+                    if engine.dialect.name == "postgresql"
+                    else ""
+                )
+                try:
+                    conn.execute(
+                        text(
+                            "CREATE INDEX IF NOT EXISTS idx_project_contexts_active "
+                            f"ON project_contexts(id){include} WHERE is_active"
+                        )
+                    )
+                except Exception:
+                    pass
+
+            # Partial index for loading running scheduled tasks
+            if "scheduled_tasks" in tables:
+                try:
+                    conn.execute(
+                        text(
+                            "CREATE INDEX IF NOT EXISTS ix_scheduled_tasks_status "
+                            "ON scheduled_tasks(status) WHERE status = 'RUNNING'"
+                        )
+                    )
+                except Exception:
+                    pass
+
     except Exception as e:
         print(f"Index creation note: {e}")
 
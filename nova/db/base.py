@@ -1,3 +1,8 @@
+from sqlalchemy import JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
+
+# JSON column type: native JSONB on Postgres, plain JSON everywhere else.
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
@@ -16,6 +16,8 @@ from sqlalchemy import (
     Enum,
     Boolean,
     ForeignKey,
+    Index,
+    text,
 )
 from sqlalchemy.orm import relationship
 
@@ -89,6 +91,18 @@ class ProjectContext(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        # Partial index over the (at most one) active row; on Postgres it also
+        # covers the columns get_active_project reads, for an index-only scan.
+        Index(
+            "idx_project_contexts_active",
+            "id",
+            postgresql_include=["name", "absolute_path", "git_remote", "metadata_json"],
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+    )
+
 
 class DeploymentQueue(Base):
     """
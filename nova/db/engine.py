@@ -1,6 +1,7 @@
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, literal_column
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
 
 from agno.db.sqlite import SqliteDb
 from agno.db.postgres import PostgresDb
@@ -29,7 +30,20 @@ def get_db_url():
 
 
 _engine = None
+_autocommit_engine = None
 _session_factory = None
+_async_engine = None
+_async_autocommit_engine = None
+
+
+def schema_init_enabled() -> bool:
+    """
+    Whether this process should create/migrate tables on startup.
+
+    Set NOVA_INIT_DB=0 on multi-worker deployments and run
+    `python migrations/migrate.py` once at deploy time instead.
+    """
+    return os.getenv("NOVA_INIT_DB", "1") == "1"
 
 
 def get_db_engine():
@@ -38,23 +52,143 @@ def get_db_engine():
     if _engine is None:
         url = get_db_url()
         if url.startswith("postgresql"):
-            _engine = create_engine(
-                url, pool_pre_ping=True, pool_size=5, max_overflow=10, echo=False
-            )
+            _engine = create_engine(url, echo=False, **_postgres_engine_options(url))
         else:
             _engine = create_engine(url)
+            event.listen(_engine, "connect", _configure_sqlite_connection)
     return _engine
 
 
+def _postgres_engine_options(url: str) -> dict:
+    """
+    Pool and driver options shared by the sync and async Postgres engines.
+
+    The scheduler, tools and job executor all share one pool; size it with
+    NOVA_DB_POOL_SIZE / NOVA_DB_MAX_OVERFLOW for bursty schedules.
+    """
+    # LIFO checkout keeps a small set of warm connections busy and
+    # lets the rest idle out instead of round-robining every backend.
+    return {
+        "pool_pre_ping": True,
+        "pool_size": int(os.getenv("NOVA_DB_POOL_SIZE", "10")),
+        "max_overflow": int(os.getenv("NOVA_DB_MAX_OVERFLOW", "20")),
+        "pool_timeout": 10,
+        "pool_recycle": 1800,
+        "pool_use_lifo": True,
+        "connect_args": _postgres_connect_args(url),
+    }
+
+
+def _postgres_connect_args(url: str) -> dict:
+    """Driver options for Postgres connections."""
+    # A stuck query gives its connection back instead of pinning it forever
+    timeout_ms = os.getenv("NOVA_DB_STATEMENT_TIMEOUT_MS", "30000")
+    connect_args = {"options": f"-c statement_timeout={timeout_ms}"}
+    if url.startswith("postgresql+psycopg://"):
+        # psycopg 3 prepares a statement server-side once it has been run this
+        # many times on a connection (default 5); prepare on the second run.
+        connect_args["prepare_threshold"] = 1
+    return connect_args
+
+
+def _configure_sqlite_connection(dbapi_connection, connection_record):
+    """Switch SQLite to WAL so readers don't block on writers and commits fsync less."""
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+    finally:
+        cursor.close()
+
+
 def get_session_factory():
     """Returns a cached sessionmaker instance."""
     global _session_factory
     if _session_factory is None:
         engine = get_db_engine()
-        _session_factory = sessionmaker(bind=engine)
+        _session_factory = sessionmaker(bind=engine, expire_on_commit=False)
     return _session_factory
 
 
+def _async_db_url(url: str) -> str:
+    """Maps a sync database URL onto its asyncio driver."""
+    if url.startswith("sqlite:"):
+        return url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+    scheme, rest = url.split("://", 1)
+    if scheme.startswith("postgresql"):
+        # psycopg 3 serves both sync and asyncio engines
+        return f"postgresql+psycopg://{rest}"
+    return url
+
+
+def get_async_db_engine():
+    """Creates/returns a cached asyncio engine for the same database."""
+    global _async_engine
+    if _async_engine is None:
+        url = _async_db_url(get_db_url())
+        if url.startswith("postgresql"):
+            _async_engine = create_async_engine(url, **_postgres_engine_options(url))
+        else:
+            _async_engine = create_async_engine(url)
+            event.listen(
+                _async_engine.sync_engine, "connect", _configure_sqlite_connection
+            )
+    return _async_engine
+
+
+def get_autocommit_engine():
+    """
+    Returns the shared engine configured for AUTOCOMMIT.
+
+    Meant for single-statement reads: they run without a BEGIN/ROLLBACK pair.
+    Shares the connection pool with get_db_engine().
+    """
+    global _autocommit_engine
+    if _autocommit_engine is None:
+        _autocommit_engine = get_db_engine().execution_options(
+            isolation_level="AUTOCOMMIT"
+        )
+    return _autocommit_engine
+
+
+def get_async_autocommit_engine():
+    """
+    Returns the shared async engine configured for AUTOCOMMIT.
+
+    A single statement then costs one round-trip, with no separate COMMIT.
+    Shares the connection pool with get_async_db_engine().
+    """
+    global _async_autocommit_engine
+    if _async_autocommit_engine is None:
+        _async_autocommit_engine = get_async_db_engine().execution_options(
+            isolation_level="AUTOCOMMIT"
+        )
+    return _async_autocommit_engine
+
+
+def upsert_insert(table):
+    """Returns a dialect-specific INSERT construct supporting ``on_conflict_do_update``."""
+    if get_db_engine().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(table)
+
+
+def upsert_inserted_column():
+    """
+    Returns a RETURNING expression that is true for rows an upsert inserted
+    and false for rows it updated, or None if the dialect has no such marker.
+
+    PostgreSQL leaves xmax at 0 only on a freshly inserted row version. On
+    other dialects callers look the keys up first, in the same transaction.
+    """
+    if get_db_engine().dialect.name == "postgresql":
+        return literal_column("xmax = 0").label("inserted")
+    return None
+
+
 def get_agno_db(session_table: str):
     """Returns an Agno-compatible DB instance."""
     url = get_db_url()
@@ -86,6 +86,7 @@ class DeploymentService:
     def stop(self):
         """Stop the deployment coordinator."""
         self._coordinator.stop()
+        self._task_tracker.flush_heartbeats()
 
     # ==================== Task Management ====================
 
@@ -10,10 +10,10 @@ import logging
 import threading
 import time
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set
 from contextlib import contextmanager
 
-from sqlalchemy import and_
+from sqlalchemy import and_, bindparam, select
 from sqlalchemy.exc import SQLAlchemyError
 
 from nova.db.engine import get_session_factory
@@ -33,6 +33,11 @@ class TaskTracker:
         self._lock = threading.RLock()
         self._local_cache: Dict[str, Dict[str, Any]] = {}
         self._heartbeat_interval = 30  # seconds
+        # Heartbeats are buffered here and written in one batch per interval
+        self._pending_heartbeats: Dict[str, datetime] = {}
+        self._last_heartbeat_flush = time.monotonic()
+        # Ids a flush found no row for; their heartbeats are refused
+        self._missing_tasks: Set[str] = set()
 
     def _get_session(self):
         """Create a new database session."""
@@ -98,6 +103,7 @@ class TaskTracker:
                     "status": TaskStatus.RUNNING,
                     "last_update": datetime.utcnow(),
                 }
+                self._missing_tasks.discard(task_id)
 
                 logger.info(f"Registered task: {task_id} ({subagent_name})")
                 return True
@@ -135,6 +141,7 @@ class TaskTracker:
 
                 # Remove from cache
                 self._local_cache.pop(task_id, None)
+                self._pending_heartbeats.pop(task_id, None)
 
                 logger.info(f"Unregistered task: {task_id}")
                 return True
@@ -147,26 +154,81 @@ class TaskTracker:
                 session.close()
 
     def update_heartbeat(self, task_id: str) -> bool:
-        """Update the last heartbeat timestamp for a task."""
-        session = self._get_session()
-        try:
-            task = (
-                session.query(ActiveTask).filter(ActiveTask.task_id == task_id).first()
-            )
+        """
+        Record a heartbeat for a task.
 
-            if not task:
+        Timestamps are buffered in memory and persisted by flush_heartbeats(),
+        which runs automatically at most once per heartbeat interval. Returns
+        False once a flush has found no row for the task.
+        """
+        now = datetime.utcnow()
+        with self._lock:
+            if task_id in self._missing_tasks:
                 return False
+            self._pending_heartbeats[task_id] = now
+            if task_id in self._local_cache:
+                self._local_cache[task_id]["last_update"] = now
+            flush_due = (
+                time.monotonic() - self._last_heartbeat_flush
+                >= self._heartbeat_interval
+            )
 
-            task.last_heartbeat = datetime.utcnow()
-            session.commit()
+        if flush_due:
+            self.flush_heartbeats()
+        return True
 
-            # Update local cache
-            if task_id in self._local_cache:
-                self._local_cache[task_id]["last_update"] = datetime.utcnow()
+    def flush_heartbeats(self) -> int:
+        """
+        Write all buffered heartbeats in a single batched UPDATE and return
+        how many tasks were updated. If the row count falls short, the ids
+        without a row are looked up once and remembered as missing.
+        """
+        with self._lock:
+            pending = self._pending_heartbeats
+            self._pending_heartbeats = {}
+            self._last_heartbeat_flush = time.monotonic()
 
-            return True
-        finally:
-            session.close()
+        if not pending:
+            return 0
+
+        table = ActiveTask.__table__
+        stmt = (
+            table.update()
+            .where(table.c.task_id == bindparam("b_task_id"))
+            .values(last_heartbeat=bindparam("b_last_heartbeat"))
+        )
+        missing = set()
+        try:
+            with self._session_scope() as session:
+                updated = session.execute(
+                    stmt,
+                    [
+                        {"b_task_id": tid, "b_last_heartbeat": ts}
+                        for tid, ts in pending.items()
+                    ],
+                ).rowcount
+                if updated != len(pending):
+                    found = set(
+                        session.scalars(
+                            select(ActiveTask.task_id).where(
+                                ActiveTask.task_id.in_(list(pending))
+                            )
+                        )
+                    )
+                    missing = set(pending) - found
+        except SQLAlchemyError:
+            # Keep the timestamps so the next flush retries them
+            with self._lock:
+                for tid, ts in pending.items():
+                    self._pending_heartbeats.setdefault(tid, ts)
+            return 0
+
+        if missing:
+            with self._lock:
+                self._missing_tasks.update(missing)
+                for tid in missing:
+                    self._local_cache.pop(tid, None)
+        return len(pending) - len(missing)
 
     def update_progress(self, task_id: str, progress: int) -> bool:
         """Update task progress percentage."""
@@ -223,6 +285,7 @@ class TaskTracker:
         subagent_name: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Get all active tasks, optionally filtered."""
+        self.flush_heartbeats()
         session = self._get_session()
         try:
             query = session.query(ActiveTask).filter(
@@ -442,6 +505,7 @@ class TaskTracker:
         Clean up tasks that have stale heartbeats.
         Returns count of cleaned up tasks.
         """
+        self.flush_heartbeats()
         session = self._get_session()
         try:
             cutoff = datetime.utcnow() - timedelta(seconds=max_heartbeat_age_seconds)
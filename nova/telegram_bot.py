@@ -22,6 +22,7 @@ from agno.media import Audio, Image, Video, File
 from nova.tools.core.prompt_transformer import (
     MiddleOutTransformer,
     get_transformer,
+    load_encoding,
     DEFAULT_TOKEN_LIMIT,
     SAFE_TOKEN_LIMIT,
 )
@@ -428,6 +429,25 @@ async def _handle_task_action(query, task_id: int, action: str):
         db.close()
 
 
+async def _toggle_task_notifications(query, task_id: int):
+    """Flip a task's notifications; its job reads the flag on every run."""
+    from nova.tools.scheduler.scheduler import get_session, ScheduledTask
+
+    db = get_session()
+    try:
+        task = db.query(ScheduledTask).filter(ScheduledTask.id == task_id).first()
+        if not task:
+            return
+        task.notification_enabled = not task.notification_enabled
+        db.commit()
+        enabled = task.notification_enabled
+    finally:
+        db.close()
+
+    await query.answer(f"Notifications {'On' if enabled else 'Off'}")
+    await _show_task_detail(query, task_id)
+
+
 async def _show_active_tasks_list(query):
     """List currently running subagents."""
     from nova.tools.scheduler.scheduler import get_session
@@ -622,17 +642,7 @@ async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
         elif query.data.startswith("mt_toggle_notify:"):
             task_id = int(query.data.split(":")[1])
-            from nova.tools.scheduler.scheduler import get_session, ScheduledTask
-            db = get_session()
-            try:
-                task = db.query(ScheduledTask).filter(ScheduledTask.id == task_id).first()
-                if task:
-                    task.notification_enabled = not task.notification_enabled
-                    db.commit()
-                    await query.answer(f"Notifications {'Off' if not task.notification_enabled else 'On'}")
-                    await _show_task_detail(query, task_id)
-            finally:
-                db.close()
+            await _toggle_task_notifications(query, task_id)
 
         elif query.data.startswith("mt_at_pause:"):
             task_id = int(query.data.split(":")[1])
@@ -1103,6 +1113,10 @@ async def post_init(application):
     except Exception as e:
         print(f"Specialist seeding failed: {e}")
 
+    # The tokenizer may need a download; load it in the background so no
+    # message waits on it (token checks use the char heuristic until then)
+    asyncio.get_running_loop().run_in_executor(None, load_encoding)
+
     # Update Bot Identity (Name, Descriptions, and Profile Picture)
     try:
         # Set Bot Name
@@ -1165,6 +1179,16 @@ async def post_init(application):
     print("Nova ready: heartbeat active, specialists seeded, scheduler running.")
 
 
+async def post_shutdown(application):
+    """Callback to run while the bot shuts down, before the loop closes."""
+    from nova.tools.scheduler.scheduler import flush_telegram_notifications
+
+    try:
+        await flush_telegram_notifications()
+    except Exception as e:
+        print(f"Notification flush failed: {e}")
+
+
 if __name__ == "__main__":
     telegram_token = os.getenv("TELEGRAM_BOT_TOKEN")
     if not telegram_token:
@@ -1172,7 +1196,11 @@ if __name__ == "__main__":
         exit(1)
 
     application = (
-        ApplicationBuilder().token(telegram_token).post_init(post_init).build()
+        ApplicationBuilder()
+        .token(telegram_token)
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .build()
     )
 
     telegram_bot_instance = application.bot
@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Optional, List
 
 import requests
+from telegram.error import TelegramError
 
 logger = logging.getLogger(__name__)
 
@@ -203,8 +204,6 @@ async def send_audio_message(
     Returns:
         True if successful, False otherwise
     """
-    from telegram.error import TelegramError
-
     try:
         # Generate TTS audio
         audio_bytes = generate_tts_audio(text, voice=voice)
@@ -6,7 +6,7 @@ import enum
 from typing import Optional
 
 from nova.db.base import Base
-from nova.db.engine import get_session_factory, get_db_engine
+from nova.db.engine import get_session_factory, get_db_engine, schema_init_enabled
 
 
 class ErrorStatus(str, enum.Enum):
@@ -247,8 +247,9 @@ async def _error_monitor_loop():
 
 def start_error_bus():
     """Initialize the error bus and monitor."""
-    engine = get_db_engine()
-    Base.metadata.create_all(engine, tables=[SystemErrorLog.__table__])
+    if schema_init_enabled():
+        engine = get_db_engine()
+        Base.metadata.create_all(engine, tables=[SystemErrorLog.__table__])
 
     # Add handler if not exists
     root_logger = logging.getLogger()
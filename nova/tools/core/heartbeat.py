@@ -33,6 +33,7 @@ HEARTBEAT_WARNING_THRESHOLD = (
 HEARTBEAT_FAILURE_NOTIFIED = (
     set()
 )  # Track which failures we've already notified Nova about
+HEARTBEAT_SCAN_YIELD_EVERY = 64  # Yield to the event loop every N records scanned
 
 
 @dataclass
@@ -143,9 +144,13 @@ class HeartbeatMonitor:
         while self._running:
             try:
                 active_records = []
-                for subagent_id in list(self._records.keys()):
+                for i, subagent_id in enumerate(list(self._records.keys()), 1):
                     record = await self._check_subagent(subagent_id)
                     active_records.append(record)
+                    # _check_subagent never actually suspends, so give other
+                    # coroutines a turn during large scans
+                    if i % HEARTBEAT_SCAN_YIELD_EVERY == 0:
+                        await asyncio.sleep(0)
 
                 # Smart recovery: notify Nova about failures/timeouts
                 await self._trigger_nova_recovery(active_records)
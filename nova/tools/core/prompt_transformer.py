@@ -17,6 +17,7 @@ Key Features:
 import os
 import re
 import logging
+from collections import OrderedDict
 from typing import Optional, List, Tuple
 from dataclasses import dataclass, field
 
@@ -33,6 +34,57 @@ CHARS_PER_TOKEN = 3.5
 MAX_PROMPT_CHARS = int(DEFAULT_TOKEN_LIMIT * CHARS_PER_TOKEN)
 SAFE_PROMPT_CHARS = int(SAFE_TOKEN_LIMIT * CHARS_PER_TOKEN)
 
+# Prompts within this fraction of the char limit get an exact token count
+TOKEN_COUNT_BAND = 0.1
+
+# Number of transformed prompts remembered per transformer (retries resend
+# the same oversized prompt), and the most characters (prompts plus their
+# results) the cache may hold
+TRANSFORM_CACHE_SIZE = 16
+TRANSFORM_CACHE_MAX_CHARS = 8 * MAX_PROMPT_CHARS
+
+# Conversation turn markers, compiled once. The system prompt ends at the
+# first match of the highest-priority marker that splits it sensibly.
+_SYSTEM_SPLIT_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (r"\n\nHuman:", r"\nHuman:", r"\n\nUser:", r"\nUser:")
+)
+_TURN_LINE_RE = re.compile(r"\n\n?(?:Human|User):.*$", re.IGNORECASE | re.MULTILINE)
+
+
+_encoding = None  # tiktoken encoding, set by load_encoding()
+
+
+def load_encoding() -> bool:
+    """
+    Load the cl100k_base tokenizer so exceeds_limit can count tokens exactly.
+
+    Meant to run once at startup, off the event loop: tiktoken may download
+    its BPE file. Until it has loaded, or if tiktoken is unavailable,
+    exceeds_limit falls back to the char heuristic.
+    """
+    global _encoding
+    try:
+        import tiktoken
+
+        _encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception as e:  # not installed, or BPE file unavailable offline
+        logger.debug(f"tiktoken unavailable, using char heuristic only: {e}")
+    return _encoding is not None
+
+
+def _join_within(parts: List[str], limit: int) -> str:
+    """Join parts, copying at most `limit` characters."""
+    out = []
+    remaining = limit
+    for part in parts:
+        if len(part) >= remaining:
+            out.append(part[:remaining])
+            break
+        out.append(part)
+        remaining -= len(part)
+    return "".join(out)
+
 
 @dataclass
 class TransformResult:
@@ -55,28 +107,36 @@ class MiddleOutTransformer:
         self.max_tokens = max_tokens
         self.max_chars = int(max_tokens * CHARS_PER_TOKEN)
         self.safe_chars = int(self.max_chars * safe_pct)
+        self._results: "OrderedDict[tuple, TransformResult]" = OrderedDict()
+        self._cached_chars = 0
 
     def estimate_tokens(self, text: str) -> int:
         return int(len(text) / CHARS_PER_TOKEN)
 
+    def exceeds_limit(self, prompt: str) -> bool:
+        """
+        Decide whether a prompt is over the token limit.
+
+        The char heuristic settles anything clearly above or below the limit;
+        only prompts within TOKEN_COUNT_BAND of max_chars are tokenized exactly.
+        """
+        length = len(prompt)
+        if length < self.max_chars * (1 - TOKEN_COUNT_BAND):
+            return False
+        if length > self.max_chars * (1 + TOKEN_COUNT_BAND):
+            return True
+
+        if _encoding is None:
+            return length > self.max_chars
+        return len(_encoding.encode(prompt, disallowed_special=())) > self.max_tokens
+
     def extract_system_prompt(self, prompt: str) -> Tuple[str, str]:
         """Extract system prompt from the full prompt."""
-        human_patterns = [
-            r"\n\nHuman:",
-            r"\nHuman:",
-            r"\n\nUser:",
-            r"\nUser:",
-            r"\n\nuser:",
-            r"\nuser:",
-        ]
-
-        for pattern in human_patterns:
-            match = re.search(pattern, prompt, re.IGNORECASE)
-            if match:
-                system_part = prompt[: match.start()]
-                remaining = prompt[match.start() :]
-                if len(system_part) > 100 and len(remaining) > 100:
-                    return system_part, remaining
+        prompt_len = len(prompt)
+        for pattern in _SYSTEM_SPLIT_RES:
+            match = pattern.search(prompt)
+            if match and match.start() > 100 and prompt_len - match.start() > 100:
+                return prompt[: match.start()], prompt[match.start() :]
 
         split_point = int(len(prompt) * 0.2)
         if split_point > 2000:
@@ -86,18 +146,9 @@ class MiddleOutTransformer:
 
     def extract_latest_message(self, prompt: str) -> Tuple[str, str]:
         """Extract the most recent user message from prompt."""
-        human_patterns = [
-            r"\n\nHuman:.*$",
-            r"\nHuman:.*$",
-            r"\n\nUser:.*$",
-            r"\nUser:.*$",
-        ]
-
         latest_pos = -1
-        for pattern in human_patterns:
-            match = re.search(pattern, prompt, re.MULTILINE | re.IGNORECASE)
-            if match and match.end() > latest_pos:
-                latest_pos = match.end()
+        for match in _TURN_LINE_RE.finditer(prompt):
+            latest_pos = match.end()
 
         if latest_pos > 0:
             return prompt[latest_pos - 100 :], prompt[:latest_pos]
@@ -112,7 +163,9 @@ class MiddleOutTransformer:
         if content_len <= max_length:
             return content
 
-        # Preserve 25% at start, 25% at end, compress middle
+        # Preserve 25% at start and 25% at end. A middle section filling the
+        # remaining half can never fit alongside the two markers, so it is not
+        # sliced; only its size feeds the omitted count.
         preserve_start = max_length // 4
         preserve_end = max_length // 4
         middle_size = max_length - preserve_start - preserve_end
@@ -120,38 +173,53 @@ class MiddleOutTransformer:
         start_section = content[:preserve_start]
         end_section = content[-preserve_end:] if content_len > preserve_end else content
 
-        # Get middle section from the middle of remaining content
-        middle_start = preserve_start
-        if middle_size > 0:
-            middle_section = content[middle_start : middle_start + middle_size]
-        else:
-            middle_section = ""
-
-        omitted = (
-            content_len - len(start_section) - len(middle_section) - len(end_section)
-        )
-
+        omitted = content_len - len(start_section) - middle_size - len(end_section)
         marker = f"--- [TRUNCATED: {omitted} chars omitted] ---\n"
 
-        result = (
-            start_section + "\n" + marker + middle_section + "\n" + marker + end_section
-        )
+        return _join_within([start_section, "\n", marker, end_section], max_length)
 
-        # If still too long, just truncate the middle more aggressively
-        if len(result) > max_length:
-            # Simple approach: just keep start and end
-            result = start_section + "\n" + marker + end_section
-            if len(result) > max_length:
-                result = result[:max_length]
+    def transform(self, prompt: str) -> TransformResult:
+        """Transform a prompt using middle-out strategy."""
+        original_length = len(prompt)
+        if original_length <= self.safe_chars:
+            # Comfortably within limits: no hashing, regex or token counting
+            return TransformResult(
+                original_length=original_length,
+                transformed_length=original_length,
+                was_transformed=False,
+                method="none",
+                preserved_sections=["full_prompt"],
+                transformed_prompt=prompt,
+            )
 
+        # Keyed on the prompt itself, so a hit is an exact match, and on
+        # max_chars, so changing the limit never serves stale results
+        key = (prompt, self.max_chars)
+        result = self._results.pop(key, None)
+        if result is None:
+            result = self._transform(prompt)
+            if not result.was_transformed:
+                return result
+        else:
+            self._cached_chars -= original_length + result.transformed_length
+
+        size = original_length + result.transformed_length
+        if size <= TRANSFORM_CACHE_MAX_CHARS:
+            self._results[key] = result
+            self._cached_chars += size
+            while (
+                len(self._results) > TRANSFORM_CACHE_SIZE
+                or self._cached_chars > TRANSFORM_CACHE_MAX_CHARS
+            ):
+                (old_prompt, _), old = self._results.popitem(last=False)
+                self._cached_chars -= len(old_prompt) + old.transformed_length
         return result
 
-    def transform(self, prompt: str) -> TransformResult:
-        """Transform a prompt using middle-out strategy."""
+    def _transform(self, prompt: str) -> TransformResult:
         original_length = len(prompt)
 
         # Check if transformation is needed
-        if original_length <= self.max_chars:
+        if not self.exceeds_limit(prompt):
             return TransformResult(
                 original_length=original_length,
                 transformed_length=original_length,
@@ -161,11 +229,12 @@ class MiddleOutTransformer:
                 transformed_prompt=prompt,
             )
 
-        logger.warning(
-            f"Prompt exceeds max limit: {original_length} chars "
-            f"(~{original_length // 4} tokens, max: {self.max_chars}). "
-            f"Applying middle-out transformation."
-        )
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                f"Prompt exceeds max limit: {original_length} chars "
+                f"(~{original_length // 4} tokens, max: {self.max_chars}). "
+                f"Applying middle-out transformation."
+            )
 
         # Step 1: Extract system prompt
         system_prompt, after_system = self.extract_system_prompt(prompt)
@@ -188,15 +257,15 @@ class MiddleOutTransformer:
 
         # Step 5: Rebuild prompt with header
         header = f"[CONTEXT COMPRESSED: {original_length // 4} -> ~{(len(system_prompt) + len(history) + len(latest_message)) // 4} tokens]\n"
-        transformed_prompt = (
-            header + system_prompt + "\n\n" + history + "\n\n" + latest_message
-        )
+        parts = [header, system_prompt, "\n\n", history, "\n\n", latest_message]
 
         # Step 6: Final truncation if still too large (with buffer)
-        if len(transformed_prompt) > self.max_chars:
+        if sum(map(len, parts)) <= self.max_chars:
+            transformed_prompt = "".join(parts)
+        else:
             # Truncate but preserve that it's been compressed
             # Reserve space for header
-            transformed_prompt = transformed_prompt[: self.max_chars - 50]
+            transformed_prompt = _join_within(parts, self.max_chars - 50)
             if "TRUNCATED" not in transformed_prompt:
                 transformed_prompt = transformed_prompt + "\n\n[... TRUNCATED ...]"
 
@@ -235,6 +304,7 @@ __all__ = [
     "MiddleOutTransformer",
     "TransformResult",
     "get_transformer",
+    "load_encoding",
     "transform_prompt",
     "DEFAULT_TOKEN_LIMIT",
     "SAFE_TOKEN_LIMIT",
@@ -10,10 +10,23 @@ Rules:
 import os
 import logging
 from typing import List, Dict, Optional
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Text,
+    DateTime,
+    JSON,
+    func,
+    select,
+)
 from datetime import datetime
 from nova.db.base import Base
-from nova.db.engine import get_session_factory
+from nova.db.engine import (
+    get_session_factory,
+    upsert_insert,
+    upsert_inserted_column,
+)
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -168,43 +181,73 @@ def _get_session():
 
 def seed_default_specialists() -> str:
     """Upsert default specialists into the database."""
+    # One multi-row upsert for all the defaults
+    now = datetime.utcnow()
+    default_model = os.getenv("SUBAGENT_MODEL", "minimax/minimax-m2.5")
+    stmt = upsert_insert(SpecialistConfig).values(
+        [
+            {
+                "name": spec["name"],
+                "role": spec["role"],
+                "instructions": spec["instructions"],
+                "model": default_model,
+                "tools": spec.get("tools", []),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for spec in DEFAULT_SPECIALISTS
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SpecialistConfig.name],
+        set_={
+            "role": stmt.excluded.role,
+            "instructions": stmt.excluded.instructions,
+            "tools": stmt.excluded.tools,
+            # Keep a model that was already chosen (empty counts as unset)
+            "model": func.coalesce(
+                func.nullif(SpecialistConfig.model, ""), stmt.excluded.model
+            ),
+            "updated_at": now,
+        },
+    )
+    inserted = upsert_inserted_column()
+
     session = _get_session()
     try:
-        updated = []
-        for spec in DEFAULT_SPECIALISTS:
-            existing = (
-                session.query(SpecialistConfig)
-                .filter(SpecialistConfig.name == spec["name"])
-                .first()
+        if inserted is not None:
+            is_new = dict(
+                session.execute(stmt.returning(SpecialistConfig.name, inserted)).all()
             )
-
-            if existing:
-                existing.role = spec["role"]
-                existing.instructions = spec["instructions"]
-                existing.tools = spec.get("tools", [])
-                if not existing.model:
-                    existing.model = os.getenv("SUBAGENT_MODEL", "minimax/minimax-m2.5")
-                updated.append(f"{spec['name']} (updated)")
-            else:
-                session.add(
-                    SpecialistConfig(
-                        name=spec["name"],
-                        role=spec["role"],
-                        instructions=spec["instructions"],
-                        model=os.getenv("SUBAGENT_MODEL", "minimax/minimax-m2.5"),
-                        tools=spec.get("tools", []),
+        else:
+            # No insert marker on this dialect: look the names up first
+            existing = set(
+                session.scalars(
+                    select(SpecialistConfig.name).where(
+                        SpecialistConfig.name.in_(
+                            [spec["name"] for spec in DEFAULT_SPECIALISTS]
+                        )
                     )
                 )
-                updated.append(spec["name"])
-
+            )
+            session.execute(stmt)
+            is_new = {
+                spec["name"]: spec["name"] not in existing
+                for spec in DEFAULT_SPECIALISTS
+            }
         session.commit()
-        return f"Seeded {len(updated)} specialists: {', '.join(updated)}"
     except Exception as e:
         session.rollback()
         return f"Error seeding specialists: {e}"
     finally:
         session.close()
 
+    updated = [
+        spec["name"] if is_new[spec["name"]] else f"{spec['name']} (updated)"
+        for spec in DEFAULT_SPECIALISTS
+    ]
+    return f"Seeded {len(updated)} specialists: {', '.join(updated)}"
+
 
 def save_specialist_config(
     name: str, role: str, instructions: str, model: str = None, tools: List[str] = None
@@ -213,25 +256,21 @@ def save_specialist_config(
     if tools and len(tools) > 5:
         return f"Error: Max 5 tools per specialist. Got {len(tools)}: {tools}. Tavily is added automatically."
 
+    values = {"name": name, "role": role, "instructions": instructions}
+    if model:
+        values["model"] = model
+    if tools is not None:
+        values["tools"] = tools
+
     session = _get_session()
     try:
-        config = (
-            session.query(SpecialistConfig)
-            .filter(SpecialistConfig.name == name)
-            .first()
+        stmt = upsert_insert(SpecialistConfig).values(**values)
+        update_cols = {col: stmt.excluded[col] for col in values if col != "name"}
+        update_cols["updated_at"] = datetime.utcnow()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SpecialistConfig.name], set_=update_cols
         )
-
-        if not config:
-            config = SpecialistConfig(name=name)
-            session.add(config)
-
-        config.role = role
-        config.instructions = instructions
-        if model:
-            config.model = model
-        if tools is not None:
-            config.tools = tools
-
+        session.execute(stmt)
         session.commit()
         return f"Specialist '{name}' saved. Tools: {tools or []}. Tavily: auto-added."
     except Exception as e:
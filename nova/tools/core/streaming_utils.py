@@ -9,6 +9,8 @@ import re
 from typing import Optional, Callable, Awaitable
 import os
 
+from telegram import Bot
+
 logger = logging.getLogger(__name__)
 
 # Minimal header format for streaming messages - just the name in brackets
@@ -140,8 +142,6 @@ def _get_telegram_bot():
     try:
         token = os.getenv("TELEGRAM_BOT_TOKEN")
         if token:
-            from telegram import Bot
-
             bot = Bot(token=token)
             _cached_bot = bot
             return bot
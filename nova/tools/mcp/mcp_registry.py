@@ -1,8 +1,8 @@
-import json
+import orjson
 from typing import List, Dict
-from sqlalchemy import Column, String, JSON
-from nova.db.base import Base
-from nova.db.engine import get_session_factory
+from sqlalchemy import Column, String, bindparam, delete, select
+from nova.db.base import Base, JSONDocument
+from nova.db.engine import get_autocommit_engine, get_session_factory, upsert_insert
 from nova.logger import setup_logging
 
 setup_logging()
@@ -13,9 +13,26 @@ class MCPServerConfig(Base):
     name = Column(String(255), primary_key=True)
     transport = Column(String(50), default="stdio")  # stdio or streamable-http
     command = Column(String(255))
-    args = Column(JSON, default=list)
+    args = Column(JSONDocument, default=list)
     url = Column(String(255))
-    env = Column(JSON, default=dict)
+    env = Column(JSONDocument, default=dict)
+
+
+_LIST_SERVERS_STMT = select(
+    MCPServerConfig.name,
+    MCPServerConfig.transport,
+    MCPServerConfig.command,
+    MCPServerConfig.args,
+    MCPServerConfig.url,
+    MCPServerConfig.env,
+)
+
+# Reports whether a row was actually removed, in the same round-trip
+_DELETE_SERVER_STMT = (
+    delete(MCPServerConfig)
+    .where(MCPServerConfig.name == bindparam("server_name"))
+    .returning(MCPServerConfig.name)
+)
 
 
 class MCPRegistry:
@@ -32,26 +49,27 @@ class MCPRegistry:
         url: str = None,
         env: Dict[str, str] = None,
     ) -> str:
-        session = self.Session()
+        stmt = upsert_insert(MCPServerConfig).values(
+            name=name,
+            transport=transport,
+            command=command,
+            args=args if args else [],
+            url=url,
+            env=env if env else {},
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MCPServerConfig.name],
+            set_={
+                col: stmt.excluded[col]
+                for col in ("transport", "command", "args", "url", "env")
+            },
+        )
         try:
-            config = session.query(MCPServerConfig).filter_by(name=name).first()
-            if not config:
-                config = MCPServerConfig(name=name)
-                session.add(config)
-
-            config.transport = transport
-            config.command = command
-            config.args = args if args else []
-            config.url = url
-            config.env = env if env else {}
-
-            session.commit()
-            return f"MCP Server '{name}' registered successfully."
+            with self.Session.begin() as session:
+                session.execute(stmt)
         except Exception as e:
-            session.rollback()
             return f"Error registering MCP server: {e}"
-        finally:
-            session.close()
+        return f"MCP Server '{name}' registered successfully."
 
     def _safe_parse_json(self, json_str, default):
         """Safely parse JSON string, returning default on failure."""
@@ -60,39 +78,34 @@ class MCPRegistry:
         if isinstance(json_str, (list, dict)):
             return json_str
         try:
-            return json.loads(json_str)
-        except (json.JSONDecodeError, ValueError):
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
             return default
 
     def list_servers(self) -> List[Dict]:
-        session = self.Session()
-        try:
-            servers = session.query(MCPServerConfig).all()
-            return [
-                {
-                    "name": s.name,
-                    "transport": s.transport,
-                    "command": s.command,
-                    "args": self._safe_parse_json(s.args, []),
-                    "url": s.url,
-                    "env": self._safe_parse_json(s.env, {}),
-                }
-                for s in servers
-            ]
-        finally:
-            session.close()
+        with get_autocommit_engine().connect() as conn:
+            servers = conn.execute(_LIST_SERVERS_STMT).all()
+        return [
+            {
+                "name": s.name,
+                "transport": s.transport,
+                "command": s.command,
+                "args": self._safe_parse_json(s.args, []),
+                "url": s.url,
+                "env": self._safe_parse_json(s.env, {}),
+            }
+            for s in servers
+        ]
 
     def remove_server(self, name: str) -> str:
-        session = self.Session()
-        try:
-            config = session.query(MCPServerConfig).filter_by(name=name).first()
-            if config:
-                session.delete(config)
-                session.commit()
-                return f"MCP Server '{name}' removed."
-            return f"MCP Server '{name}' not found."
-        finally:
-            session.close()
+        with self.Session.begin() as session:
+            deleted = session.execute(
+                _DELETE_SERVER_STMT, {"server_name": name}
+            ).first()
+
+        if deleted:
+            return f"MCP Server '{name}' removed."
+        return f"MCP Server '{name}' not found."
 
 
 # Global Registry
@@ -33,6 +33,16 @@ def remove_mcp_server(name: str) -> str:
     return mcp_registry.remove_server(name)
 
 
+def _format_server(s: Dict) -> str:
+    """Render one registry entry as a block of report lines."""
+    block = f"- {s['name']} ({s['transport']})"
+    if s["command"]:
+        block += f"\n  Command: {s['command']} {' '.join(s['args'])}"
+    if s["url"]:
+        block += f"\n  URL: {s['url']}"
+    return block
+
+
 @wrap_tool_output_optimization
 def list_registered_mcp_servers() -> str:
     """Lists all registered MCP servers and their configurations."""
@@ -40,11 +50,6 @@ def list_registered_mcp_servers() -> str:
     if not servers:
         return "No MCP servers registered."
 
-    report = ["Registered MCP Servers:"]
-    for s in servers:
-        report.append(f"- {s['name']} ({s['transport']})")
-        if s["command"]:
-            report.append(f"  Command: {s['command']} {' '.join(s['args'])}")
-        if s["url"]:
-            report.append(f"  URL: {s['url']}")
-    return "\n".join(report)
+    lines = ["Registered MCP Servers:"]
+    lines.extend(_format_server(s) for s in servers)
+    return "\n".join(lines)
@@ -12,17 +12,22 @@ Supports notification via Telegram Webhooks and full CRUD operations.
 import os
 import sys
 import asyncio
+import functools
 import logging
+import tempfile
+import threading
 import httpx
-from datetime import datetime
-from typing import Optional, Dict, Any, List
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, List, Set, Tuple
 import enum
-from croniter import croniter
+from apscheduler.job import Job
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.util import utc_timestamp_to_datetime
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.executors.asyncio import AsyncIOExecutor
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
+from apscheduler.jobstores.base import JobLookupError
 from sqlalchemy import (
     Column,
     Integer,
@@ -31,12 +36,23 @@ from sqlalchemy import (
     DateTime,
     Text,
     Enum,
-    JSON,
+    Index,
+    bindparam,
+    delete,
+    func,
+    select,
     text,
+    update,
+)
+from sqlalchemy.orm import defer
+from nova.db.base import Base, JSONDocument
+from nova.db.engine import (
+    get_async_autocommit_engine,
+    get_autocommit_engine,
+    get_db_engine,
+    get_session_factory,
+    schema_init_enabled,
 )
-from sqlalchemy.orm import sessionmaker
-from nova.db.base import Base
-from nova.db.engine import get_db_engine, get_session_factory
 from dotenv import load_dotenv
 from nova.tools.core.context_optimizer import wrap_tool_output_optimization
 
@@ -67,6 +83,12 @@ class TaskType(str, enum.Enum):
     INLINE_SCRIPT = "inline_script"
 
 
+# The predicate of the partial index on running tasks. Queries that should use
+# the index filter with this literal: a bound parameter can't be matched to
+# the index's WHERE clause by the planner.
+_RUNNING_TASK_FILTER = text("status = 'RUNNING'")
+
+
 class ScheduledTask(Base):
     """Scheduled task database model."""
 
@@ -82,15 +104,38 @@ class ScheduledTask(Base):
         Text, nullable=True
     )  # System instructions for subagent
     subagent_task = Column(Text, nullable=True)  # Task prompt for subagent
-    team_members = Column(JSON, nullable=True)  # List of specialist names for TEAM_TASK
+    team_members = Column(
+        JSONDocument, nullable=True
+    )  # List of specialist names for TEAM_TASK
     status = Column(Enum(TaskStatus), default=TaskStatus.RUNNING)
     notification_enabled = Column(Boolean, default=True)
     target_chat_id = Column(String(100), nullable=True)  # Specific chat ID for alerts
     last_run = Column(DateTime, nullable=True)
     last_status = Column(String(50), nullable=True)  # success, failure, skipped
     last_output = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Timestamps come from the database clock; default= renders now() inline so
+    # tables created before server_default was declared still get a value.
+    # The migration converts older naive Postgres columns to timestamptz.
+    created_at = Column(
+        DateTime(timezone=True), default=func.now(), server_default=func.now()
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=func.now(),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    __table_args__ = (
+        # start_scheduler and sync load only running tasks; the partial index
+        # keeps that lookup off a full table scan as paused tasks accumulate.
+        Index(
+            "ix_scheduled_tasks_status",
+            "status",
+            postgresql_where=_RUNNING_TASK_FILTER,
+            sqlite_where=_RUNNING_TASK_FILTER,
+        ),
+    )
 
 
 # ============================================================================
@@ -107,11 +152,89 @@ def get_session():
 # SCHEDULER IMPLEMENTATION
 # ============================================================================
 
+# last_output keeps this many characters of a run's output
+LAST_OUTPUT_MAX_CHARS = 5000
+# Bytes captured per stream; enough for LAST_OUTPUT_MAX_CHARS of any UTF-8 text
+OUTPUT_CAPTURE_BYTES = 4 * LAST_OUTPUT_MAX_CHARS
+
+# A watcher script prints this, followed by a payload, to wake Nova up
+WATCHER_TRIGGER_MARKER = "__NOVA_TRIGGER__"
+
+# Watcher and inline scripts are killed after this many seconds
+SCRIPT_TIMEOUT_SECONDS = 120
+
+# Watcher and inline scripts are written here before they run: tmpfs where
+# the host has it, so script bodies never touch disk
+_SCRIPT_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Defaults applied to every scheduled job
+JOB_DEFAULTS = {
+    "coalesce": True,  # Combine missed runs into one
+    "max_instances": 1,  # Only one instance at a time
+    "misfire_grace_time": 300,  # 5 minutes grace period
+}
+
+# Jobs reference the executor by import path; APScheduler stores this string
+# as-is instead of deriving (and re-verifying) a reference from the callable.
+JOB_EXECUTOR_REF = "nova.tools.scheduler.scheduler:_job_executor"
+
+# get_scheduler_status lists at most this many upcoming jobs
+STATUS_MAX_JOBS = 50
+
+# Task types that can be created or switched to through the tools, in the
+# order they are listed in error messages
+_TASK_TYPE_CHOICES = (
+    "standalone_sh",
+    "subagent_recall",
+    "team_task",
+    "silent",
+    "alert",
+    "inline_script",
+)
+_VALID_TASK_TYPES = frozenset(_TASK_TYPE_CHOICES)
+
+# Delay before the first run of a task created with run_immediately
+IMMEDIATE_RUN_DELAY = timedelta(seconds=1)
+
+# Jobstore rows whose id matches no task, either as "<id>" or "manual_<id>"
+_ORPHANED_JOBS_STMT = text(
+    "SELECT id FROM apscheduler_jobs WHERE id NOT IN ("
+    "SELECT CAST(id AS VARCHAR(20)) FROM scheduled_tasks "
+    "UNION ALL SELECT 'manual_' || CAST(id AS VARCHAR(20)) FROM scheduled_tasks)"
+)
+
+# Deletes a batch of jobstore rows by id in one round-trip
+_DELETE_JOBS_STMT = text("DELETE FROM apscheduler_jobs WHERE id IN :ids").bindparams(
+    bindparam("ids", expanding=True)
+)
+
 # Global scheduler instance
 _scheduler: Optional[AsyncIOScheduler] = None
+_jobstore: Optional[SQLAlchemyJobStore] = None
+_scheduler_lock = threading.Lock()
+# Ids of paused tasks, so a job that fires while its task is being paused is
+# dropped without a DB read. Seeded by start_scheduler.
+_paused_ids: set = set()
 _scheduler_initialized: bool = False
 
 
+def _remove_jobs(job_ids: Set[str]):
+    """
+    Remove jobs from the scheduler and the jobstore table; the table rows go
+    in a single DELETE however many ids there are.
+    """
+    scheduler = get_scheduler()
+    # Jobs only sit in memory while the scheduler is stopped (pending adds);
+    # once running, the table is the only copy.
+    if not scheduler.running:
+        for job in scheduler.get_jobs():
+            if job.id in job_ids:
+                scheduler.remove_job(job.id)
+
+    with get_db_engine().begin() as conn:
+        conn.execute(_DELETE_JOBS_STMT, {"ids": list(job_ids)})
+
+
 def _cleanup_all_orphaned_jobs():
     """
     Clean up all orphaned APScheduler jobs that have no corresponding DB record.
@@ -122,49 +245,22 @@ def _cleanup_all_orphaned_jobs():
         return
 
     try:
-        db = get_session()
         engine = get_db_engine()
-        scheduler = get_scheduler()
-
-        try:
-            # Get job IDs directly from the database table (not in-memory)
-            with engine.connect() as conn:
-                result = conn.execute(text("SELECT id FROM apscheduler_jobs"))
-                apscheduler_job_ids = {row[0] for row in result.fetchall()}
 
-            # Get all task IDs from DB (including active and paused)
-            db_tasks = db.query(ScheduledTask).all()
-            db_task_ids = {str(task.id) for task in db_tasks}
-
-            # Also handle manual trigger jobs (prefixed with "manual_")
-            db_task_ids.update({f"manual_{t.id}" for t in db_tasks})
-
-            # Find orphaned jobs (in APScheduler but not in DB)
-            orphaned_jobs = apscheduler_job_ids - db_task_ids
-
-            # Remove orphaned jobs directly from the database table
-            for job_id in orphaned_jobs:
-                try:
-                    # Remove from in-memory scheduler if loaded
-                    scheduler.remove_job(job_id)
-                except Exception as e:
-                    # Job might not be loaded in memory, that's ok
-                    pass
-
-                # Always try to remove from the database table
-                try:
-                    with engine.connect() as conn:
-                        conn.execute(
-                            text("DELETE FROM apscheduler_jobs WHERE id = :id"),
-                            {"id": job_id},
-                        )
-                        conn.commit()
-                    logger.info(f"Cleaned up orphaned APScheduler job: {job_id}")
-                except Exception as e:
-                    logger.debug(f"Failed to remove job {job_id} from DB: {e}")
+        # Jobs with no task row (recurring or manual_) are found by the
+        # database; only the orphan ids come back.
+        with engine.connect() as conn:
+            orphaned_jobs = set(conn.execute(_ORPHANED_JOBS_STMT).scalars())
 
-        finally:
-            db.close()
+        if orphaned_jobs:
+            try:
+                _remove_jobs(orphaned_jobs)
+                logger.info(
+                    f"Cleaned up {len(orphaned_jobs)} orphaned APScheduler jobs: "
+                    f"{', '.join(sorted(orphaned_jobs))}"
+                )
+            except Exception as e:
+                logger.debug(f"Failed to remove orphaned jobs: {e}")
 
         _scheduler_initialized = True
 
@@ -176,32 +272,32 @@ def _cleanup_all_orphaned_jobs():
 
 def get_scheduler() -> AsyncIOScheduler:
     """Get or create the global scheduler instance."""
-    global _scheduler
+    global _scheduler, _jobstore
 
     if _scheduler is not None:
         return _scheduler
 
-    # Create database engine for job store
-    engine = get_db_engine()
-    jobstores = {
-        "default": SQLAlchemyJobStore(
+    with _scheduler_lock:
+        # Another thread may have built it while we waited for the lock
+        if _scheduler is not None:
+            return _scheduler
+
+        # Create database engine for job store
+        engine = get_db_engine()
+        _jobstore = SQLAlchemyJobStore(
             engine=engine, metadata=Base.metadata, tablename="apscheduler_jobs"
         )
-    }
-
-    # Create executor for running async jobs
-    executors = {"default": AsyncIOExecutor()}
-
-    _scheduler = AsyncIOScheduler(
-        jobstores=jobstores,
-        executors=executors,
-        job_defaults={
-            "coalesce": True,  # Combine missed runs into one
-            "max_instances": 1,  # Only one instance at a time
-            "misfire_grace_time": 300,  # 5 minutes grace period
-        },
-        timezone="UTC",
-    )
+        jobstores = {"default": _jobstore}
+
+        # Create executor for running async jobs
+        executors = {"default": AsyncIOExecutor()}
+
+        _scheduler = AsyncIOScheduler(
+            jobstores=jobstores,
+            executors=executors,
+            job_defaults=JOB_DEFAULTS,
+            timezone="UTC",
+        )
 
     # Clean up orphaned jobs on first scheduler creation
     _cleanup_all_orphaned_jobs()
@@ -209,28 +305,256 @@ def get_scheduler() -> AsyncIOScheduler:
     return _scheduler
 
 
+# Outgoing Telegram notifications are queued and sent by a single worker so a
+# burst of job notifications never blocks the jobs themselves on the API.
+TELEGRAM_MAX_MESSAGE_CHARS = 4096
+TELEGRAM_BATCH_SEPARATOR = "\n---\n"
+TELEGRAM_MAX_BATCH = 20
+# On shutdown, queued notifications get this many seconds to go out
+TELEGRAM_FLUSH_TIMEOUT = 10.0
+
+# Read once at import (after load_dotenv); a restart picks up new values
+_TG_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
+_TG_DEFAULT_CHAT = os.getenv("TELEGRAM_CHAT_ID")
+_TG_SEND_URL = f"https://api.telegram.org/bot{_TG_TOKEN}/sendMessage"
+
+_tg_queue: Optional[asyncio.Queue] = None
+_tg_worker_task: Optional[asyncio.Task] = None
+
+
+def _start_telegram_worker():
+    """Start the notification worker on the running loop if it isn't running."""
+    global _tg_queue, _tg_worker_task
+    loop = asyncio.get_running_loop()
+    if (
+        _tg_worker_task is not None
+        and not _tg_worker_task.done()
+        and _tg_worker_task.get_loop() is loop
+    ):
+        return
+    if _tg_queue is not None and not _tg_queue.empty():
+        logger.warning(
+            f"Dropped {_tg_queue.qsize()} queued Telegram notifications "
+            f"left by a stopped worker"
+        )
+    _tg_queue = asyncio.Queue()
+    _tg_worker_task = loop.create_task(_telegram_worker())
+
+
+async def flush_telegram_notifications(timeout: float = TELEGRAM_FLUSH_TIMEOUT):
+    """
+    Send the notifications still queued, then stop the worker.
+
+    Called on application shutdown; whatever is not sent within `timeout`
+    seconds is dropped and the count logged.
+    """
+    global _tg_worker_task
+    task = _tg_worker_task
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        return
+
+    try:
+        await asyncio.wait_for(_tg_queue.join(), timeout)
+    except asyncio.TimeoutError:
+        pass
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    _tg_worker_task = None
+
+
+def _coalesce_messages(messages: List[str]) -> List[str]:
+    """Join queued messages into as few Telegram-sized messages as possible."""
+    batches: List[str] = []
+    current = ""
+    for message in messages:
+        message = message[:TELEGRAM_MAX_MESSAGE_CHARS]
+        if not current:
+            current = message
+        elif (
+            len(current) + len(TELEGRAM_BATCH_SEPARATOR) + len(message)
+            <= TELEGRAM_MAX_MESSAGE_CHARS
+        ):
+            current = current + TELEGRAM_BATCH_SEPARATOR + message
+        else:
+            batches.append(current)
+            current = message
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def _post_telegram_message(client: httpx.AsyncClient, chat_id: str, text: str):
+    """Send one message, waiting out Telegram's retry_after on HTTP 429."""
+    payload = {"chat_id": chat_id, "text": text}
+
+    for _ in range(3):
+        response = await client.post(_TG_SEND_URL, json=payload)
+        if response.status_code == 200:
+            logger.info(f"Successfully sent notification to chat {chat_id}")
+            return
+        if response.status_code == 429:
+            try:
+                retry_after = response.json()["parameters"]["retry_after"]
+            except Exception:
+                retry_after = 1
+            logger.warning(f"Telegram rate limited, retrying in {retry_after}s")
+            await asyncio.sleep(retry_after)
+            continue
+        logger.error(f"Telegram API failed: {response.text}")
+        return
+    else:
+        logger.error(f"Telegram still rate limited, dropped message to chat {chat_id}")
+
+
+async def _telegram_worker():
+    """Drain the notification queue, coalescing bursts per chat."""
+    # One long-lived client: its keep-alive connection to api.telegram.org is
+    # reused for every message and closed when the worker is cancelled.
+    async with httpx.AsyncClient(
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=5, keepalive_expiry=60.0),
+    ) as client:
+        pending: List[Tuple[str, str]] = []
+        try:
+            while True:
+                pending = [await _tg_queue.get()]
+                while len(pending) < TELEGRAM_MAX_BATCH:
+                    try:
+                        pending.append(_tg_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                by_chat: Dict[str, List[str]] = {}
+                for chat_id, message in pending:
+                    by_chat.setdefault(chat_id, []).append(message)
+
+                # Chats are independent, so send to them concurrently
+                await asyncio.gather(
+                    *(
+                        _send_chat_messages(client, chat_id, messages)
+                        for chat_id, messages in by_chat.items()
+                    )
+                )
+                for _ in pending:
+                    _tg_queue.task_done()
+                pending = []
+        finally:
+            unsent = len(pending) + _tg_queue.qsize()
+            if unsent:
+                logger.warning(
+                    f"Telegram worker stopped, dropped {unsent} queued notifications"
+                )
+
+
+async def _send_chat_messages(
+    client: httpx.AsyncClient, chat_id: str, messages: List[str]
+):
+    """Send one chat's queued messages in order."""
+    for chunk in _coalesce_messages(messages):
+        try:
+            await _post_telegram_message(client, chat_id, chunk)
+        except Exception as e:
+            logger.error(f"Failed to send telegram notification to {chat_id}: {e}")
+
+
 async def _send_telegram_notification(message: str, chat_id: Optional[str] = None):
-    """Send notification via Telegram API Webhook."""
-    token = os.getenv("TELEGRAM_BOT_TOKEN")
-    default_chat_id = os.getenv("TELEGRAM_CHAT_ID")
-    target_chat_id = chat_id or default_chat_id
+    """Queue a notification for the Telegram worker."""
+    target_chat_id = chat_id or _TG_DEFAULT_CHAT
 
-    if not token or not target_chat_id:
+    if not _TG_TOKEN or not target_chat_id:
         logger.error(f"Telegram credentials missing. Chat ID: {target_chat_id}")
         return
 
-    url = f"https://api.telegram.org/bot{token}/sendMessage"
-    payload = {"chat_id": str(target_chat_id), "text": message}
+    _start_telegram_worker()
+    _tg_queue.put_nowait((str(target_chat_id), message))
+
+
+async def _read_capped(
+    stream: asyncio.StreamReader, limit: int, start_marker: Optional[bytes] = None
+) -> bytes:
+    """
+    Read a pipe to EOF, keeping only the first `limit` bytes.
+
+    With `start_marker`, the kept bytes start at the marker's first
+    occurrence however far into the stream it is, and are empty if it never
+    appears.
+    """
+    buf = bytearray()
+    found = start_marker is None
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            break
+        if not found:
+            buf += chunk
+            pos = buf.find(start_marker)
+            if pos < 0:
+                # Keep only enough to match a marker split across reads
+                del buf[: len(buf) - len(start_marker) + 1]
+                continue
+            found = True
+            del buf[:pos]
+            del buf[limit:]
+        elif len(buf) < limit:
+            buf += chunk[: limit - len(buf)]
+    return bytes(buf) if found else b""
+
+
+async def _run_script(
+    interpreter: List[str],
+    source: str,
+    suffix: str,
+    timeout: float = SCRIPT_TIMEOUT_SECONDS,
+    stdout_marker: Optional[bytes] = None,
+):
+    """
+    Write `source` to a temporary script file and run it with `interpreter`,
+    without blocking the event loop. The file is removed afterwards; the
+    script gets an empty stdin.
+
+    Returns (returncode, stdout, stderr) as text, each stream capped at
+    OUTPUT_CAPTURE_BYTES (stdout from `stdout_marker` on, if given); the
+    process is killed and asyncio.TimeoutError raised if it outlives `timeout`.
+    """
+    with tempfile.NamedTemporaryFile(
+        mode="w", suffix=suffix, dir=_SCRIPT_DIR, encoding="utf-8", delete=False
+    ) as f:
+        f.write(source)
+        script_path = f.name
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=payload, timeout=10.0)
-            if response.status_code == 200:
-                logger.info(f"Successfully sent notification to chat {target_chat_id}")
-            else:
-                logger.error(f"Telegram API failed: {response.text}")
-    except Exception as e:
-        logger.error(f"Failed to send telegram notification to {target_chat_id}: {e}")
+        process = await asyncio.create_subprocess_exec(
+            *interpreter,
+            script_path,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+        async def run():
+            stdout, stderr = await asyncio.gather(
+                _read_capped(process.stdout, OUTPUT_CAPTURE_BYTES, stdout_marker),
+                _read_capped(process.stderr, OUTPUT_CAPTURE_BYTES),
+            )
+            await process.wait()
+            return stdout, stderr
+
+        try:
+            stdout, stderr = await asyncio.wait_for(run(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+    finally:
+        os.remove(script_path)
+    return (
+        process.returncode,
+        stdout.decode("utf-8", errors="replace"),
+        stderr.decode("utf-8", errors="replace"),
+    )
 
 
 async def _execute_standalone_shell(
@@ -240,12 +564,27 @@ async def _execute_standalone_shell(
     logger.info(f"Executing standalone script: {script_path}")
 
     try:
-        # Run the shell script
-        process = await asyncio.create_subprocess_shell(
-            script_path, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
+        # Run the script directly when it is a plain executable path; anything
+        # else (arguments, pipes, ...) is a shell command line
+        if os.path.isfile(script_path) and os.access(script_path, os.X_OK):
+            process = await asyncio.create_subprocess_exec(
+                script_path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        else:
+            process = await asyncio.create_subprocess_shell(
+                script_path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
 
-        stdout, stderr = await process.communicate()
+        # Only the head of the output is ever stored, so don't buffer the rest
+        stdout, stderr = await asyncio.gather(
+            _read_capped(process.stdout, OUTPUT_CAPTURE_BYTES),
+            _read_capped(process.stderr, OUTPUT_CAPTURE_BYTES),
+        )
+        await process.wait()
         output = stdout.decode("utf-8", errors="replace")
         error = stderr.decode("utf-8", errors="replace")
 
@@ -262,6 +601,29 @@ async def _execute_standalone_shell(
         return "failure", str(e)
 
 
+# Handler dependencies are imported on first use (importing them at module
+# load would be circular) and cached, so later fires skip the import machinery.
+@functools.lru_cache(maxsize=None)
+def _load_create_subagent():
+    from nova.tools.agents.subagent import create_subagent
+
+    return create_subagent
+
+
+@functools.lru_cache(maxsize=None)
+def _load_run_team_task():
+    from nova.tools.agents.team_manager import run_team_task
+
+    return run_team_task
+
+
+@functools.lru_cache(maxsize=None)
+def _load_reinvigorate_nova():
+    from nova.telegram_bot import reinvigorate_nova
+
+    return reinvigorate_nova
+
+
 async def _execute_subagent_recall(
     job_id: int,
     subagent_name: str,
@@ -274,8 +636,7 @@ async def _execute_subagent_recall(
     logger.info(f"Executing subagent recall: {subagent_name}")
 
     try:
-        # Import here to avoid circular imports
-        from nova.tools.agents.subagent import create_subagent
+        create_subagent = _load_create_subagent()
 
         # Create subagent asynchronously
         # Use the task's notification setting to determine silence
@@ -317,7 +678,7 @@ async def _execute_team_task(
     logger.info(f"Executing scheduled team task: {task_name}")
 
     try:
-        from nova.tools.agents.team_manager import run_team_task
+        run_team_task = _load_run_team_task()
 
         result = await run_team_task(
             task_name=task_name,
@@ -365,61 +726,63 @@ async def _execute_watcher_task(
         return "failure", "No script content provided for watcher."
 
     try:
-        import tempfile
-        import subprocess
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write(script_content)
-            temp_path = f.name
-
-        try:
-            result = subprocess.run(
-                [sys.executable, temp_path],
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=120,
-            )
+        # Only the output from the marker on is kept, however much precedes it
+        returncode, stdout, stderr = await _run_script(
+            [sys.executable],
+            script_content,
+            ".py",
+            stdout_marker=WATCHER_TRIGGER_MARKER.encode(),
+        )
 
-            output = result.stdout.strip()
+        _, marker, payload = stdout.partition(WATCHER_TRIGGER_MARKER)
 
-            if "__NOVA_TRIGGER__" in output:
-                # Extract payload: anything after __NOVA_TRIGGER__
-                parts = output.split("__NOVA_TRIGGER__", 1)
-                payload = (
-                    parts[1].strip() if len(parts) > 1 else "Triggered without payload"
-                )
+        if marker:
+            payload = payload.strip()
 
-                # Trigger reinvigorate_nova
-                from nova.telegram_bot import reinvigorate_nova
+            # Trigger reinvigorate_nova
+            reinvigorate_nova = _load_reinvigorate_nova()
 
-                chat_id = target_chat_id or os.getenv("TELEGRAM_CHAT_ID")
+            chat_id = target_chat_id or _TG_DEFAULT_CHAT
 
-                if chat_id:
-                    trigger_msg = f"🔍 **Watcher Alert (Job {job_id}):**\n{payload}"
-                    asyncio.create_task(reinvigorate_nova(chat_id, trigger_msg))
-                    return "success", f"Triggered: {payload}"
-                else:
-                    logger.warning(
-                        "Watcher triggered but no chat_id available to notify"
-                    )
-                    return "success", "Triggered but no chat_id"
-
-            if result.returncode != 0:
-                logger.error(f"Watcher script failed: {result.stderr}")
-                return "failure", result.stderr
+            if chat_id:
+                trigger_msg = f"🔍 **Watcher Alert (Job {job_id}):**\n{payload}"
+                asyncio.create_task(reinvigorate_nova(chat_id, trigger_msg))
+                return "success", f"Triggered: {payload}"
+            else:
+                logger.warning(
+                    "Watcher triggered but no chat_id available to notify"
+                )
+                return "success", "Triggered but no chat_id"
 
-            return "success", "Completed silently (no trigger)"
+        if returncode != 0:
+            logger.error(f"Watcher script failed: {stderr}")
+            return "failure", stderr
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        return "success", "Completed silently (no trigger)"
 
     except Exception as e:
         logger.error(f"Failed to execute watcher task: {e}")
         return "failure", str(e)
 
 
+# Inline script languages: '#lang:' names, shebang markers (checked in order)
+# and the interpreter and script file suffix for each.
+_LANG_ALIASES = {
+    "sh": "sh",
+    "shell": "sh",
+    "bash": "sh",
+    "js": "js",
+    "javascript": "js",
+    "node": "js",
+}
+_SHEBANG_LANGS = (("python", "python"), ("node", "js"), ("js", "js"), ("sh", "sh"))
+_INTERPRETERS = {
+    "python": ([sys.executable], ".py"),
+    "js": (["node"], ".js"),
+    "sh": (["bash"], ".sh"),
+}
+
+
 async def _execute_inline_script(
     job_id: int,
     script_body: str,
@@ -434,92 +797,57 @@ async def _execute_inline_script(
       2. Shebang line (#!/.../python, #!/.../node, #!/bin/sh etc.)
       3. Default: python
     """
-    import tempfile
-    import subprocess
-
     logger.info(f"Executing inline_script task: job_id={job_id}")
 
     if not script_body:
         return "failure", "No script body provided."
 
-    # --- Language detection ---
-    lines = script_body.strip().splitlines()
-    first_line = lines[0].strip().lower() if lines else ""
+    # --- Language detection (only the first line is inspected) ---
+    first_line, _, rest = script_body.strip().partition("\n")
+    first_line = first_line.strip().lower()
 
     lang = "python"  # default
     if first_line.startswith("#lang:"):
-        detected = first_line.replace("#lang:", "").strip()
-        if detected in ("sh", "shell", "bash"):
-            lang = "sh"
-        elif detected in ("js", "javascript", "node"):
-            lang = "js"
-        else:
-            lang = "python"
+        lang = _LANG_ALIASES.get(first_line[len("#lang:") :].strip(), "python")
         # Strip the #lang directive from the actual body we execute
-        script_body = "\n".join(lines[1:])
+        script_body = rest
     elif first_line.startswith("#!"):
-        if "python" in first_line:
-            lang = "python"
-        elif "node" in first_line or "js" in first_line:
-            lang = "js"
-        elif any(s in first_line for s in ("sh", "bash", "zsh")):
-            lang = "sh"
-
-    # --- Choose interpreter and file extension ---
-    if lang == "python":
-        suffix = ".py"
-        interpreter = [sys.executable]
-    elif lang == "js":
-        suffix = ".js"
-        interpreter = ["node"]
-    else:  # sh
-        suffix = ".sh"
-        interpreter = ["bash"]
-
-    # --- Write to temp file and run ---
-    try:
-        with tempfile.NamedTemporaryFile(mode="w", suffix=suffix, delete=False) as f:
-            f.write(script_body)
-            temp_path = f.name
+        lang = next(
+            (name for marker, name in _SHEBANG_LANGS if marker in first_line),
+            "python",
+        )
 
-        try:
-            result = subprocess.run(
-                interpreter + [temp_path],
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=120,
-            )
+    interpreter, suffix = _INTERPRETERS[lang]
 
-            stdout = (result.stdout or "").strip()
-            stderr = (result.stderr or "").strip()
-            succeeded = result.returncode == 0
+    # --- Write to a temp file and run ---
+    try:
+        returncode, stdout, stderr = await _run_script(interpreter, script_body, suffix)
 
-            if succeeded:
-                output = stdout
-                status = "success"
-            else:
-                output = f"[FAIL] Exit code {result.returncode}\n{stderr}\n{stdout}"
-                status = "failure"
-
-            # Notify if enabled
-            if notification_enabled and output:
-                snippet = output[:1000]
-                await _send_telegram_notification(
-                    f"[{lang.upper()}] Job {job_id} output:\n{snippet}",
-                    chat_id=target_chat_id,
-                )
+        stdout = stdout.strip()
+        stderr = stderr.strip()
+        succeeded = returncode == 0
 
-            logger.info(f"Inline script completed: status={status}")
-            return status, output
+        if succeeded:
+            output = stdout
+            status = "success"
+        else:
+            output = f"[FAIL] Exit code {returncode}\n{stderr}\n{stdout}"
+            status = "failure"
+
+        # Notify if enabled
+        if notification_enabled and output:
+            snippet = output[:1000]
+            await _send_telegram_notification(
+                f"[{lang.upper()}] Job {job_id} output:\n{snippet}",
+                chat_id=target_chat_id,
+            )
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        logger.info(f"Inline script completed: status={status}")
+        return status, output
 
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         logger.error(f"Inline script timed out: job_id={job_id}")
-        return "failure", "Script timed out after 120s."
+        return "failure", f"Script timed out after {SCRIPT_TIMEOUT_SECONDS}s."
     except FileNotFoundError as e:
         logger.error(f"Interpreter not found for lang={lang}: {e}")
         return "failure", f"Interpreter not found: {e}"
@@ -531,33 +859,63 @@ async def _execute_inline_script(
 def _cleanup_orphaned_job(job_id: str):
     """Remove an orphaned APScheduler job that has no corresponding DB task."""
     try:
-        scheduler = get_scheduler()
-        scheduler.remove_job(job_id)
+        _remove_jobs({job_id})
         logger.info(f"Cleaned up orphaned APScheduler job: {job_id}")
     except Exception as e:
-        logger.debug(f"Job {job_id} already removed or not found: {e}")
+        logger.debug(f"Failed to remove job {job_id}: {e}")
+
+
+# The columns _job_executor reads. Leaves last_output (up to
+# LAST_OUTPUT_MAX_CHARS) and the timestamps behind.
+_TASK_RUN_COLUMNS = (
+    ScheduledTask.id,
+    ScheduledTask.task_name,
+    ScheduledTask.task_type,
+    ScheduledTask.script_path,
+    ScheduledTask.subagent_name,
+    ScheduledTask.subagent_instructions,
+    ScheduledTask.subagent_task,
+    ScheduledTask.team_members,
+    ScheduledTask.notification_enabled,
+    ScheduledTask.target_chat_id,
+)
 
-    # Also remove from database table directly
-    try:
-        engine = get_db_engine()
-        with engine.connect() as conn:
-            conn.execute(
-                text("DELETE FROM apscheduler_jobs WHERE id = :id"), {"id": job_id}
-            )
-            conn.commit()
-    except Exception as e:
-        logger.debug(f"Failed to remove job {job_id} from DB table: {e}")
+# ...for a task that is still running
+_RUNNABLE_TASK_STMT = select(*_TASK_RUN_COLUMNS).where(
+    ScheduledTask.id == bindparam("job_id"),
+    ScheduledTask.status == TaskStatus.RUNNING,
+)
 
 
-async def _job_executor(job_id: int):
-    """Main job executor that dispatches to the appropriate handler."""
-    # Get job data from database
-    db = get_session()
+async def _job_executor(job_id: int, **stale_kwargs):
+    """
+    Main job executor that dispatches to the appropriate handler.
+
+    A firing costs one SELECT of the running task's row and one UPDATE with
+    the result. `stale_kwargs` absorbs the task_snapshot that jobs stored by
+    earlier versions still pass; it is ignored.
+    """
+    if job_id in _paused_ids:
+        logger.info(f"Task {job_id} is paused, skipping")
+        return
 
     try:
-        task = db.query(ScheduledTask).filter(ScheduledTask.id == job_id).first()
+        # Each DB step is a single autocommit statement (one round-trip, no
+        # COMMIT), and no connection is held across the handler await.
+        async with get_async_autocommit_engine().connect() as conn:
+            task = (await conn.execute(_RUNNABLE_TASK_STMT, {"job_id": job_id})).first()
+
+            if not task:
+                # Paused or gone; only now check which
+                exists = await conn.scalar(
+                    select(ScheduledTask.id).where(ScheduledTask.id == job_id)
+                )
 
         if not task:
+            if exists:
+                logger.info(f"Task {job_id} is paused, skipping")
+                return
+
             # Task not found in DB - this is an orphaned job in APScheduler
             # Clean it up to prevent future errors
             logger.debug(
@@ -566,10 +924,6 @@ async def _job_executor(job_id: int):
             _cleanup_orphaned_job(str(job_id))
             return
 
-        if task.status != TaskStatus.RUNNING:
-            logger.info(f"Task {task.task_name} is paused, skipping")
-            return
-
         logger.info(f"Running scheduled task: {task.task_name}")
 
         target_chat_id = task.target_chat_id
@@ -648,21 +1002,33 @@ async def _job_executor(job_id: int):
             logger.error(f"Unknown task type: {task.task_type}")
             return
 
-        # Update task status
-        task.last_run = datetime.utcnow()
-        task.last_status = status
-        task.last_output = output[:5000] if output else None  # Truncate long outputs
-        db.commit()
+        # Update task status: one UPDATE of just these columns
+        async with get_async_autocommit_engine().connect() as conn:
+            result = await conn.execute(
+                update(ScheduledTask)
+                .where(ScheduledTask.id == job_id)
+                .values(
+                    # last_run is a naive UTC column
+                    last_run=datetime.now(timezone.utc).replace(tzinfo=None),
+                    last_status=status,
+                    last_output=output[:LAST_OUTPUT_MAX_CHARS] if output else None,
+                )
+            )
+        if result.rowcount == 0:
+            logger.debug(
+                f"Task {job_id} was deleted while running. Cleaning up its job."
+            )
+            _cleanup_orphaned_job(str(job_id))
 
         # Proactive Recovery: Wake up Nova on failure if notifications are enabled
         if task.notification_enabled and status == "failure":
             logger.info(
                 f"Triggering proactive recovery for failed task: {task.task_name}"
             )
-            chat_id = target_chat_id or os.getenv("TELEGRAM_CHAT_ID")
+            chat_id = target_chat_id or _TG_DEFAULT_CHAT
             if chat_id:
                 try:
-                    from nova.telegram_bot import reinvigorate_nova
+                    reinvigorate_nova = _load_reinvigorate_nova()
 
                     fail_msg = f"⚠️ Scheduled task '{task.task_name}' (ID: {task.id}) failed.\nError: {output[:1000]}"
                     asyncio.create_task(reinvigorate_nova(chat_id, fail_msg))
@@ -686,10 +1052,10 @@ async def _job_executor(job_id: int):
     except Exception as e:
         logger.error(f"Job execution failed: {e}")
         # PROACTIVE RECOVERY: Wake up Nova if a scheduled job hits a code/system error
-        chat_id = os.getenv("TELEGRAM_CHAT_ID")
+        chat_id = _TG_DEFAULT_CHAT
         if chat_id:
             try:
-                from nova.telegram_bot import reinvigorate_nova
+                reinvigorate_nova = _load_reinvigorate_nova()
 
                 asyncio.create_task(
                     reinvigorate_nova(
@@ -700,19 +1066,26 @@ async def _job_executor(job_id: int):
                 )
             except Exception:
                 pass
-    finally:
-        db.close()
 
 
+@functools.lru_cache(maxsize=1024)
 def _validate_cron(schedule: str) -> bool:
     """Validate a cron schedule string."""
     try:
-        croniter(schedule)
+        # Parsing warms the trigger cache the job is later scheduled with
+        _cron_trigger(schedule)
         return True
     except Exception:
         return False
 
 
+@functools.lru_cache(maxsize=1024)
+def _cron_trigger(schedule: str) -> CronTrigger:
+    """Parse a crontab expression once; triggers are immutable and shareable."""
+    # Pin to the scheduler's UTC clock rather than resolving the host zone
+    return CronTrigger.from_crontab(schedule, timezone=timezone.utc)
+
+
 # ============================================================================
 # PUBLIC API TOOLS
 # ============================================================================
@@ -777,9 +1150,10 @@ def add_scheduled_task(
         )
 
     # Validate task type
-    valid_types = ["standalone_sh", "subagent_recall", "team_task", "silent", "alert", "inline_script"]
-    if task_type not in valid_types:
-        return f"Error: Invalid task_type. Must be one of: {valid_types}"
+    if task_type not in _VALID_TASK_TYPES:
+        return (
+            f"Error: Invalid task_type. Must be one of: {', '.join(_TASK_TYPE_CHOICES)}"
+        )
 
     # Validate type-specific fields
     if task_type == "standalone_sh" and not script_path:
@@ -799,16 +1173,20 @@ def add_scheduled_task(
 
     # Default to global chat_id if not provided
     if not chat_id:
-        chat_id = os.getenv("TELEGRAM_CHAT_ID")
+        chat_id = _TG_DEFAULT_CHAT
 
     # Save to database
 
     db = get_session()
 
     try:
-        # Check for existing task
-        existing = (
-            db.query(ScheduledTask).filter(ScheduledTask.task_name == task_name).first()
+        # Check for existing task (probe of the unique task_name index)
+        existing = db.scalar(
+            select(
+                select(ScheduledTask.id)
+                .where(ScheduledTask.task_name == task_name)
+                .exists()
+            )
         )
         if existing:
             return f"Error: Task '{task_name}' already exists. Use update_scheduled_task to modify."
@@ -834,13 +1212,7 @@ def add_scheduled_task(
 
         # Add to scheduler
         scheduler = get_scheduler()
-        scheduler.add_job(
-            _job_executor,
-            trigger=CronTrigger.from_crontab(schedule),
-            id=str(task.id),
-            args=[task.id],
-            replace_existing=True,
-        )
+        _schedule_task_job(scheduler, task)
 
         logger.info(f"Added scheduled task: {task_name}")
 
@@ -849,11 +1221,10 @@ def add_scheduled_task(
         # (including Agno's thread pool executor where tool calls run).
         if run_immediately:
             try:
-                from datetime import datetime, timedelta
                 scheduler.add_job(
-                    _job_executor,
+                    JOB_EXECUTOR_REF,
                     trigger="date",
-                    run_date=datetime.utcnow() + timedelta(seconds=1),
+                    run_date=datetime.now(timezone.utc) + IMMEDIATE_RUN_DELAY,
                     args=[task.id],
                     id=f"immediate_{task.id}",
                     replace_existing=True,
@@ -871,40 +1242,81 @@ def add_scheduled_task(
         db.close()
 
 
+# Columns shown by list_scheduled_tasks; skips the large TEXT columns
+_LIST_TASKS_STMT = select(
+    ScheduledTask.id,
+    ScheduledTask.task_name,
+    ScheduledTask.task_type,
+    ScheduledTask.schedule,
+    ScheduledTask.status,
+    ScheduledTask.notification_enabled,
+    ScheduledTask.target_chat_id,
+    ScheduledTask.last_run,
+    ScheduledTask.last_status,
+).order_by(ScheduledTask.id)
+
+
+def _format_task_summary(task) -> str:
+    """Render one task row for list_scheduled_tasks, with a trailing blank line."""
+    notifications = "On" if task.notification_enabled else "Off"
+    text = (
+        f"**ID: {task.id} | {task.task_name}**\n"
+        f"  Type: {task.task_type}\n"
+        f"  Schedule: {task.schedule}\n"
+        f"  Status: {task.status.value}\n"
+        f"  Notifications: {notifications}\n"
+    )
+    if task.target_chat_id:
+        text += f"  Target Chat: {task.target_chat_id}\n"
+    if task.last_run:
+        text += f"  Last Run: {task.last_run.strftime('%Y-%m-%d %H:%M:%S')} ({task.last_status})\n"
+    return text
+
+
 @wrap_tool_output_optimization
 def list_scheduled_tasks() -> str:
     """List all scheduled tasks."""
-
-    db = get_session()
-
-    try:
-        tasks = db.query(ScheduledTask).order_by(ScheduledTask.id).all()
-
-        if not tasks:
-            return "No scheduled tasks found."
-
-        lines = ["[SCH] Scheduled Tasks", ""]
-
-        for task in tasks:
-            lines.append(f"**ID: {task.id} | {task.task_name}**")
-            lines.append(f"  Type: {task.task_type}")
-            lines.append(f"  Schedule: {task.schedule}")
-            lines.append(f"  Status: {task.status.value}")
-            lines.append(
-                f"  Notifications: {'On' if task.notification_enabled else 'Off'}"
-            )
-            if task.target_chat_id:
-                lines.append(f"  Target Chat: {task.target_chat_id}")
-            if task.last_run:
-                lines.append(
-                    f"  Last Run: {task.last_run.strftime('%Y-%m-%d %H:%M:%S')} ({task.last_status})"
-                )
-            lines.append("")
-
-        return "\n".join(lines)
-
-    finally:
-        db.close()
+    with get_autocommit_engine().connect() as conn:
+        tasks = conn.execute(_LIST_TASKS_STMT).all()
+
+    if not tasks:
+        return "No scheduled tasks found."
+
+    lines = ["[SCH] Scheduled Tasks", ""]
+    lines.extend(_format_task_summary(task) for task in tasks)
+    return "\n".join(lines)
+
+
+def _format_task_details(task) -> str:
+    """Render the full detail view of one task for get_scheduled_task."""
+    notifications = "Enabled" if task.notification_enabled else "Disabled"
+    text = (
+        f"**Task: {task.task_name}**\n"
+        f"\n"
+        f"ID: {task.id}\n"
+        f"Type: {task.task_type}\n"
+        f"Schedule: {task.schedule}\n"
+        f"Status: {task.status.value}\n"
+        f"Notifications: {notifications}"
+    )
+    if task.target_chat_id:
+        text += f"\nTarget Chat: {task.target_chat_id}"
+    if task.script_path:
+        text += f"\nScript: {task.script_path}"
+    if task.subagent_name:
+        text += f"\nSubagent Name: {task.subagent_name}"
+    if task.subagent_instructions:
+        text += f"\nInstructions: {task.subagent_instructions}"
+    if task.subagent_task:
+        text += f"\nTask: {task.subagent_task}"
+    if task.last_run:
+        text += (
+            f"\nLast Run: {task.last_run.strftime('%Y-%m-%d %H:%M:%S')}"
+            f"\nLast Status: {task.last_status}"
+        )
+    if task.last_output:
+        text += f"\nLast Output:\n{task.last_output[:500]}"
+    return text
 
 
 @wrap_tool_output_optimization
@@ -921,37 +1333,7 @@ def get_scheduled_task(task_name: str) -> str:
         if not task:
             return f"Error: Task '{task_name}' not found."
 
-        lines = [f"**Task: {task.task_name}**", ""]
-        lines.append(f"ID: {task.id}")
-        lines.append(f"Type: {task.task_type}")
-        lines.append(f"Schedule: {task.schedule}")
-        lines.append(f"Status: {task.status.value}")
-        lines.append(
-            f"Notifications: {'Enabled' if task.notification_enabled else 'Disabled'}"
-        )
-        if task.target_chat_id:
-            lines.append(f"Target Chat: {task.target_chat_id}")
-
-        if task.script_path:
-            lines.append(f"Script: {task.script_path}")
-
-        if task.subagent_name:
-            lines.append(f"Subagent Name: {task.subagent_name}")
-
-        if task.subagent_instructions:
-            lines.append(f"Instructions: {task.subagent_instructions}")
-
-        if task.subagent_task:
-            lines.append(f"Task: {task.subagent_task}")
-
-        if task.last_run:
-            lines.append(f"Last Run: {task.last_run.strftime('%Y-%m-%d %H:%M:%S')}")
-            lines.append(f"Last Status: {task.last_status}")
-
-        if task.last_output:
-            lines.append(f"Last Output:\n{task.last_output[:500]}")
-
-        return "\n".join(lines)
+        return _format_task_details(task)
 
     finally:
         db.close()
@@ -993,8 +1375,12 @@ def update_scheduled_task(
     db = get_session()
 
     try:
+        # last_output is never touched here; leave it in the database
         task = (
-            db.query(ScheduledTask).filter(ScheduledTask.task_name == task_name).first()
+            db.query(ScheduledTask)
+            .options(defer(ScheduledTask.last_output))
+            .filter(ScheduledTask.task_name == task_name)
+            .first()
         )
 
         if not task:
@@ -1007,15 +1393,8 @@ def update_scheduled_task(
             task.schedule = schedule
 
         if task_type is not None:
-            valid_types = [
-                "standalone_sh",
-                "subagent_recall",
-                "team_task",
-                "silent",
-                "alert",
-            ]
-            if task_type not in valid_types:
-                return f"Error: Invalid task_type. Must be one of: {valid_types}"
+            if task_type not in _VALID_TASK_TYPES:
+                return f"Error: Invalid task_type. Must be one of: {', '.join(_TASK_TYPE_CHOICES)}"
             task.task_type = TaskType(task_type)
 
         if script_path is not None:
@@ -1049,19 +1428,14 @@ def update_scheduled_task(
 
         # Update scheduler job
         scheduler = get_scheduler()
-        try:
-            scheduler.remove_job(str(task.id))
-        except:
-            pass
-
         if task.status == TaskStatus.RUNNING:
-            scheduler.add_job(
-                _job_executor,
-                trigger=CronTrigger.from_crontab(task.schedule),
-                id=str(task.id),
-                args=[task.id],
-                replace_existing=True,
-            )
+            # Replaces the existing job, picking up a changed schedule
+            _schedule_task_job(scheduler, task)
+        else:
+            try:
+                scheduler.remove_job(str(task.id))
+            except JobLookupError:
+                pass
 
         return f"[OK] Task '{task_name}' updated successfully."
 
@@ -1079,22 +1453,23 @@ def remove_scheduled_task(task_name: str) -> str:
     db = get_session()
 
     try:
-        task = (
-            db.query(ScheduledTask).filter(ScheduledTask.task_name == task_name).first()
-        )
+        task_id = db.execute(
+            delete(ScheduledTask)
+            .where(ScheduledTask.task_name == task_name)
+            .returning(ScheduledTask.id)
+        ).scalar_one_or_none()
 
-        if not task:
+        if task_id is None:
             return f"Error: Task '{task_name}' not found."
 
-        task_id = task.id
-        db.delete(task)
         db.commit()
+        _paused_ids.discard(task_id)
 
         # Remove from scheduler
         scheduler = get_scheduler()
         try:
             scheduler.remove_job(str(task_id))
-        except:
+        except JobLookupError:
             pass
 
         return f"✅ Task '{task_name}' removed successfully."
@@ -1113,21 +1488,25 @@ def pause_scheduled_task(task_name: str) -> str:
     db = get_session()
 
     try:
-        task = (
-            db.query(ScheduledTask).filter(ScheduledTask.task_name == task_name).first()
-        )
-
-        if not task:
+        task_id = db.execute(
+            update(ScheduledTask)
+            .where(ScheduledTask.task_name == task_name)
+            .values(status=TaskStatus.PAUSED)
+            .returning(ScheduledTask.id)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+
+        if task_id is None:
             return f"Error: Task '{task_name}' not found."
 
-        task.status = TaskStatus.PAUSED
         db.commit()
+        _paused_ids.add(task_id)
 
         # Remove from scheduler
         scheduler = get_scheduler()
         try:
-            scheduler.remove_job(str(task.id))
-        except:
+            scheduler.remove_job(str(task_id))
+        except JobLookupError:
             pass
 
         return f"[PAUSED] Task '{task_name}' paused."
@@ -1145,28 +1524,32 @@ def resume_scheduled_task(task_name: str) -> str:
     db = get_session()
 
     try:
-        task = (
-            db.query(ScheduledTask).filter(ScheduledTask.task_name == task_name).first()
-        )
-
-        if not task:
-            return f"Error: Task '{task_name}' not found."
-
-        if task.status == TaskStatus.RUNNING:
+        # Flip the status and read back only what the job needs
+        task = db.execute(
+            update(ScheduledTask)
+            .where(
+                ScheduledTask.task_name == task_name,
+                ScheduledTask.status != TaskStatus.RUNNING,
+            )
+            .values(status=TaskStatus.RUNNING)
+            .returning(ScheduledTask.id, ScheduledTask.schedule)
+            .execution_options(synchronize_session=False)
+        ).first()
+
+        if task is None:
+            exists = db.scalar(
+                select(ScheduledTask.id).where(ScheduledTask.task_name == task_name)
+            )
+            if exists is None:
+                return f"Error: Task '{task_name}' not found."
             return f"Task '{task_name}' is already active."
 
-        task.status = TaskStatus.RUNNING
         db.commit()
+        _paused_ids.discard(task.id)
 
         # Add to scheduler
         scheduler = get_scheduler()
-        scheduler.add_job(
-            _job_executor,
-            trigger=CronTrigger.from_crontab(task.schedule),
-            id=str(task.id),
-            args=[task.id],
-            replace_existing=True,
-        )
+        _schedule_task_job(scheduler, task)
 
         return f"[RESUMED] Task '{task_name}' resumed."
 
@@ -1180,126 +1563,144 @@ def resume_scheduled_task(task_name: str) -> str:
 def run_scheduled_task_now(task_name: str) -> str:
     """Manually trigger a scheduled task immediately."""
 
-    db = get_session()
-
     try:
-        task = (
-            db.query(ScheduledTask).filter(ScheduledTask.task_name == task_name).first()
-        )
+        with get_autocommit_engine().connect() as conn:
+            task_id = conn.execute(
+                select(ScheduledTask.id).where(ScheduledTask.task_name == task_name)
+            ).scalar_one_or_none()
 
-        if not task:
+        if task_id is None:
             return f"Error: Task '{task_name}' not found."
 
         # Create a one-time job
         scheduler = get_scheduler()
         job = scheduler.add_job(
-            _job_executor,
+            JOB_EXECUTOR_REF,
             "date",
-            run_date=datetime.utcnow(),
-            id=f"manual_{task.id}",
-            args=[task.id],
+            run_date=datetime.now(timezone.utc),
+            id=f"manual_{task_id}",
+            args=[task_id],
         )
 
         return f"🚀 Task '{task_name}' triggered manually."
 
     except Exception as e:
         return f"Error: {e}"
-    finally:
-        db.close()
 
 
-def sync_scheduler_with_db() -> str:
-    """
-    Synchronize APScheduler jobs with the database.
-    Removes orphaned jobs that no longer have corresponding DB records.
-    """
-    scheduler = get_scheduler()
-    db = get_session()
-    engine = get_db_engine()
+def _job_is_current(job: Job, task) -> bool:
+    """Whether a stored job already runs the executor on the task's trigger."""
+    return (
+        job.func_ref == JOB_EXECUTOR_REF
+        and repr(job.trigger) == repr(_cron_trigger(task.schedule))
+        # Jobs from earlier versions also carry a task_snapshot
+        and not job.kwargs
+    )
 
-    try:
-        # Get all APScheduler jobs directly from the database table
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT id FROM apscheduler_jobs"))
-            apscheduler_job_ids = {row[0] for row in result.fetchall()}
 
-        # Get ALL tasks from DB (active and paused) for orphaned job detection
-        all_tasks = db.query(ScheduledTask).all()
-        all_task_ids = {str(task.id) for task in all_tasks}
+def _sync_jobs(
+    scheduler: AsyncIOScheduler, refresh: bool = False
+) -> Tuple[int, int, list, Set[int]]:
+    """
+    Reconcile the jobstore with scheduled_tasks: drop jobs whose task is gone
+    and write jobs for running tasks that have none. With `refresh`, running
+    tasks whose stored job is out of date are rewritten too.
 
-        # Also handle manual trigger jobs (prefixed with "manual_")
-        all_task_ids.update({f"manual_{t.id}" for t in all_tasks})
+    Returns (removed, added, running task rows, paused task ids) so callers
+    can reuse the reads.
+    """
+    # Every task's id and status, the running tasks with the columns needed
+    # to build their job (through the partial index), and the stored jobs:
+    # loaded through the jobstore only when they are compared
+    with get_autocommit_engine().connect() as conn:
+        task_states = conn.execute(select(ScheduledTask.id, ScheduledTask.status)).all()
+        running_tasks = conn.execute(
+            select(
+                ScheduledTask.id, ScheduledTask.task_name, ScheduledTask.schedule
+            ).where(_RUNNING_TASK_FILTER)
+        ).all()
+        if not refresh:
+            apscheduler_job_ids = set(
+                conn.execute(text("SELECT id FROM apscheduler_jobs")).scalars()
+            )
+    if refresh:
+        stored_jobs = {job.id: job for job in _jobstore.get_all_jobs()}
+        apscheduler_job_ids = set(stored_jobs)
 
-        # Get only active tasks for missing job addition
-        active_tasks = (
-            db.query(ScheduledTask)
-            .filter(ScheduledTask.status == TaskStatus.RUNNING)
-            .all()
-        )
-        active_task_ids = {str(task.id) for task in active_tasks}
+    # Jobs belong to a task as "<id>" or, for manual triggers, "manual_<id>"
+    all_task_ids = {str(t.id) for t in task_states}
+    all_task_ids.update({f"manual_{t.id}" for t in task_states})
+    paused_ids = {t.id for t in task_states if t.status == TaskStatus.PAUSED}
 
-        # Find orphaned jobs (in APScheduler but not in DB)
-        orphaned_jobs = apscheduler_job_ids - all_task_ids
+    # Find orphaned jobs (in APScheduler but not in DB)
+    orphaned_jobs = apscheduler_job_ids - all_task_ids
 
-        # Find missing jobs (in DB but not in APScheduler) - only active ones
-        missing_jobs = active_task_ids - apscheduler_job_ids
+    # Find missing jobs (in DB but not in APScheduler) - only active ones
+    missing_tasks = [t for t in running_tasks if str(t.id) not in apscheduler_job_ids]
 
-        # Remove orphaned jobs
-        removed_count = 0
-        for job_id in orphaned_jobs:
-            try:
-                # Remove from in-memory scheduler if loaded
-                scheduler.remove_job(job_id)
-            except Exception as e:
-                pass  # Job might not be in memory
+    # Remove orphaned jobs in one statement
+    removed_count = 0
+    if orphaned_jobs:
+        try:
+            _remove_jobs(orphaned_jobs)
+            logger.info(f"Removed orphaned jobs: {', '.join(sorted(orphaned_jobs))}")
+            removed_count = len(orphaned_jobs)
+        except Exception as e:
+            logger.debug(f"Failed to remove orphaned jobs: {e}")
+
+    # Add missing (and, when refreshing, stale) jobs
+    to_store = missing_tasks
+    if refresh:
+        to_store = [
+            t
+            for t in running_tasks
+            if str(t.id) not in stored_jobs
+            or not _job_is_current(stored_jobs[str(t.id)], t)
+        ]
+    for task in to_store:
+        _schedule_task_job(scheduler, task)
+    for task in missing_tasks:
+        logger.info(f"Added missing job for task: {task.task_name}")
+
+    return removed_count, len(missing_tasks), running_tasks, paused_ids
 
-            # Remove from database table
-            try:
-                with engine.connect() as conn:
-                    conn.execute(
-                        text("DELETE FROM apscheduler_jobs WHERE id = :id"),
-                        {"id": job_id},
-                    )
-                    conn.commit()
-                logger.info(f"Removed orphaned job: {job_id}")
-                removed_count += 1
-            except Exception as e:
-                logger.debug(f"Failed to remove job {job_id}: {e}")
 
-        # Add missing jobs
-        added_count = 0
-        for task in active_tasks:
-            if str(task.id) in missing_jobs:
-                try:
-                    scheduler.add_job(
-                        _job_executor,
-                        trigger=CronTrigger.from_crontab(task.schedule),
-                        id=str(task.id),
-                        args=[task.id],
-                        replace_existing=True,
-                    )
-                    logger.info(f"Added missing job for task: {task.task_name}")
-                    added_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to add job for task {task.task_name}: {e}")
+def sync_scheduler_with_db() -> str:
+    """
+    Synchronize APScheduler jobs with the database.
+    Removes orphaned jobs that no longer have corresponding DB records.
+    """
+    scheduler = get_scheduler()
 
-        return "[OK] Sync complete. Removed {removed_count} orphaned jobs, added {added_count} missing jobs."
+    try:
+        removed_count, added_count, _, _ = _sync_jobs(scheduler)
+        return f"[OK] Sync complete. Removed {removed_count} orphaned jobs, added {added_count} missing jobs."
 
     except Exception as e:
         logger.error(f"Scheduler sync failed: {e}")
         return f"Error during sync: {e}"
-    finally:
-        db.close()
+
+
+def _schedule_task_job(scheduler: AsyncIOScheduler, task: ScheduledTask):
+    """Add (or replace) the recurring job for an active task."""
+    scheduler.add_job(
+        JOB_EXECUTOR_REF,
+        trigger=_cron_trigger(task.schedule),
+        id=str(task.id),
+        args=[task.id],
+        replace_existing=True,
+    )
 
 
 @wrap_tool_output_optimization
 def start_scheduler() -> str:
     """Start the scheduler background service."""
     try:
-        # Initialize database
-        from migrations.migrate import run_migrations
+        # Initialize database (skipped when migrations run once at deploy)
+        if schema_init_enabled():
+            from migrations.migrate import run_migrations
 
-        run_migrations()
+            run_migrations()
 
         # Get scheduler (this triggers cleanup of orphaned jobs)
         scheduler = get_scheduler()
@@ -1307,32 +1708,23 @@ def start_scheduler() -> str:
         if scheduler.running:
             return "Scheduler is already running."
 
-        # Sync scheduler with database first (cleanup orphaned jobs)
-        sync_result = sync_scheduler_with_db()
-        logger.info(f"Scheduler sync: {sync_result}")
-
-        # Add existing active tasks from database
-        db = get_session()
+        # The jobstore only creates its table on start; the sync reads it first
+        _jobstore.jobs_t.create(_jobstore.engine, checkfirst=True)
 
-        try:
-            active_tasks = (
-                db.query(ScheduledTask)
-                .filter(ScheduledTask.status == TaskStatus.RUNNING)
-                .all()
-            )
-
-            for task in active_tasks:
-                scheduler.add_job(
-                    _job_executor,
-                    trigger=CronTrigger.from_crontab(task.schedule),
-                    id=str(task.id),
-                    args=[task.id],
-                    replace_existing=True,
-                )
-                logger.info(f"Loaded task: {task.task_name}")
+        # One pass over the tasks: drop orphaned jobs and (re)write the jobs
+        # of active tasks that are missing or out of date
+        removed_count, added_count, running_tasks, paused_ids = _sync_jobs(
+            scheduler, refresh=True
+        )
+        logger.info(
+            f"Scheduler sync: removed {removed_count} orphaned jobs, "
+            f"added {added_count} missing jobs"
+        )
+        for task in running_tasks:
+            logger.info(f"Loaded task: {task.task_name}")
 
-        finally:
-            db.close()
+        _paused_ids.clear()
+        _paused_ids.update(paused_ids)
 
         # Start scheduler
         scheduler.start()
@@ -1372,12 +1764,29 @@ def get_scheduler_status() -> str:
         if not scheduler.running:
             return "Scheduler: Stopped"
 
-        jobs = scheduler.get_jobs()
+        # Read ids and run times straight from the jobstore table; get_jobs()
+        # would unpickle every job just to print two fields.
+        jobs_t = _jobstore.jobs_t
+        with _jobstore.engine.connect() as conn:
+            job_count = conn.execute(select(func.count()).select_from(jobs_t)).scalar()
+            jobs = conn.execute(
+                select(jobs_t.c.id, jobs_t.c.next_run_time)
+                .order_by(jobs_t.c.next_run_time)
+                .limit(STATUS_MAX_JOBS)
+            ).all()
 
-        lines = [f"Scheduler: Running", f"Active Jobs: {len(jobs)}", ""]
+        lines = [f"Scheduler: Running", f"Active Jobs: {job_count}", ""]
 
         for job in jobs:
-            lines.append(f"  - {job.id}: next run at {job.next_run_time}")
+            next_run = (
+                utc_timestamp_to_datetime(job.next_run_time)
+                if job.next_run_time is not None
+                else None
+            )
+            lines.append(f"  - {job.id}: next run at {next_run}")
+
+        if job_count > len(jobs):
+            lines.append(f"  ... and {job_count - len(jobs)} more")
 
         return "\n".join(lines)
 
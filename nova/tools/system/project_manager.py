@@ -6,18 +6,54 @@ using the database-backed ProjectContext.
 """
 
 import os
-import json
+import orjson
 import logging
+from datetime import datetime
 from typing import Optional, Dict, Any, List
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-
-from nova.db.engine import get_session_factory
+from sqlalchemy import update, select, or_, func
+from sqlalchemy.orm import aliased
+
+from nova.db.engine import (
+    get_autocommit_engine,
+    get_session_factory,
+    upsert_insert,
+    upsert_inserted_column,
+)
 from nova.db.deployment_models import ProjectContext
 from nova.tools.core.context_optimizer import wrap_tool_output_optimization
 
 logger = logging.getLogger(__name__)
 
+# Built once so SQLAlchemy's compiled cache (and psycopg's server-side
+# prepared statements) are reused on every call.
+_ACTIVE_PROJECT_STMT = (
+    select(
+        ProjectContext.id,
+        ProjectContext.name,
+        ProjectContext.absolute_path,
+        ProjectContext.git_remote,
+        ProjectContext.metadata_json,
+    )
+    .where(ProjectContext.is_active)
+    .limit(1)
+)
+
+_LIST_PROJECTS_STMT = select(
+    ProjectContext.name,
+    ProjectContext.absolute_path,
+    ProjectContext.git_remote,
+    ProjectContext.is_active,
+)
+
+
+def _format_project(p) -> str:
+    """Render one project row for list_projects."""
+    active_mark = "🌟 [ACTIVE]" if p.is_active else "  "
+    line = f"{active_mark} **{p.name}** -> `{p.absolute_path}`"
+    if p.git_remote:
+        line += f"\n     Git: {p.git_remote}"
+    return line
+
 
 @wrap_tool_output_optimization
 def set_active_project(name: str) -> str:
@@ -30,32 +66,32 @@ def set_active_project(name: str) -> str:
     Returns:
         Status message confirming the project change.
     """
-    session_factory = get_session_factory()
-    session = session_factory()
-
-    try:
-        # Check if project exists
-        project = (
-            session.query(ProjectContext).filter(ProjectContext.name == name).first()
+    # Flip is_active in one statement: only the currently active row(s) and
+    # the target are touched, and nothing changes if the target is missing.
+    target = aliased(ProjectContext)
+    stmt = (
+        update(ProjectContext)
+        .where(
+            or_(ProjectContext.is_active.is_(True), ProjectContext.name == name),
+            select(target.id).where(target.name == name).exists(),
         )
-        if not project:
-            return f"❌ Project '{name}' not found. Please add it first using add_or_update_project."
-
-        # Deactivate all others
-        session.query(ProjectContext).update({ProjectContext.is_active: False})
-
-        # Activate target
-        project.is_active = True
-        session.commit()
-
-        return f"✅ Successfully set active project to '{name}' (Path: {project.absolute_path})"
+        .values(is_active=(ProjectContext.name == name))
+        .returning(ProjectContext.name, ProjectContext.absolute_path)
+        .execution_options(synchronize_session=False)
+    )
 
+    try:
+        with get_session_factory().begin() as session:
+            rows = session.execute(stmt).all()
     except Exception as e:
-        session.rollback()
         logger.error(f"Error setting active project: {e}")
         return f"❌ Database error: {str(e)}"
-    finally:
-        session.close()
+
+    absolute_path = next((r.absolute_path for r in rows if r.name == name), None)
+    if absolute_path is None:
+        return f"❌ Project '{name}' not found. Please add it first using add_or_update_project."
+
+    return f"✅ Successfully set active project to '{name}' (Path: {absolute_path})"
 
 
 @wrap_tool_output_optimization
@@ -77,45 +113,60 @@ def add_or_update_project(name: str, absolute_path: str, git_remote: str = "") -
     if not os.path.exists(absolute_path):
         return f"❌ Error: the path '{absolute_path}' does not exist on the filesystem."
 
-    session_factory = get_session_factory()
-    session = session_factory()
+    now = datetime.utcnow()
+    stmt = upsert_insert(ProjectContext).values(
+        name=name,
+        absolute_path=absolute_path,
+        git_remote=git_remote,
+        is_active=False,
+        created_at=now,
+        updated_at=now,
+    )
+    update_cols = {"absolute_path": stmt.excluded.absolute_path, "updated_at": now}
+    if git_remote:
+        update_cols["git_remote"] = stmt.excluded.git_remote
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ProjectContext.name], set_=update_cols
+    )
+    inserted = upsert_inserted_column()
 
     try:
-        project = (
-            session.query(ProjectContext).filter(ProjectContext.name == name).first()
-        )
-
-        if project:
-            project.absolute_path = absolute_path
-            if git_remote:
-                project.git_remote = git_remote
-            msg = f"✅ Updated existing project '{name}'."
-        else:
-            project = ProjectContext(
-                name=name,
-                absolute_path=absolute_path,
-                git_remote=git_remote,
-                is_active=False,
-            )
-            session.add(project)
-            msg = f"✅ Added new project '{name}'."
-
-        session.commit()
-
-        # If it's the only project, make it active
-        project_count = session.query(ProjectContext).count()
-        if project_count == 1:
-            set_active_project(name)
-            msg += f" Automatically set as active project."
-
-        return msg
-
+        with get_session_factory().begin() as session:
+            if inserted is not None:
+                is_new = session.execute(stmt.returning(inserted)).scalar_one()
+            else:
+                # No insert marker on this dialect: look the name up first
+                is_new = (
+                    session.scalar(
+                        select(ProjectContext.id).where(ProjectContext.name == name)
+                    )
+                    is None
+                )
+                session.execute(stmt)
+
+            # If it's the only project, make it active (same transaction)
+            activated = session.execute(
+                update(ProjectContext)
+                .where(
+                    ProjectContext.name == name,
+                    select(func.count(ProjectContext.id)).scalar_subquery() == 1,
+                )
+                .values(is_active=True)
+                .execution_options(synchronize_session=False)
+            ).rowcount
     except Exception as e:
-        session.rollback()
         logger.error(f"Error adding project: {e}")
         return f"❌ Database error: {str(e)}"
-    finally:
-        session.close()
+
+    if is_new:
+        msg = f"✅ Added new project '{name}'."
+    else:
+        msg = f"✅ Updated existing project '{name}'."
+
+    if activated:
+        msg += f" Automatically set as active project."
+
+    return msg
 
 
 @wrap_tool_output_optimization
@@ -127,33 +178,31 @@ def get_active_project() -> str:
     Returns:
         JSON string containing active project details, or null if no active project.
     """
-    session_factory = get_session_factory()
-    session = session_factory()
-
     try:
-        project = session.query(ProjectContext).filter(ProjectContext.is_active).first()
+        with get_autocommit_engine().connect() as conn:
+            project = conn.execute(_ACTIVE_PROJECT_STMT).first()
 
         if not project:
-            return json.dumps({"status": "error", "message": "No active project set."})
+            return orjson.dumps(
+                {"status": "error", "message": "No active project set."}
+            ).decode()
 
-        return json.dumps(
+        return orjson.dumps(
             {
                 "status": "success",
                 "id": project.id,
                 "name": project.name,
                 "absolute_path": project.absolute_path,
                 "git_remote": project.git_remote,
-                "metadata": json.loads(project.metadata_json)
+                "metadata": orjson.loads(project.metadata_json)
                 if project.metadata_json
                 else {},
             }
-        )
+        ).decode()
 
     except Exception as e:
         logger.error(f"Error getting active project: {e}")
-        return json.dumps({"status": "error", "message": str(e)})
-    finally:
-        session.close()
+        return orjson.dumps({"status": "error", "message": str(e)}).decode()
 
 
 @wrap_tool_output_optimization
@@ -164,26 +213,17 @@ def list_projects() -> str:
     Returns:
         Formatted string listing all projects and identifying the active one.
     """
-    session_factory = get_session_factory()
-    session = session_factory()
-
     try:
-        projects = session.query(ProjectContext).all()
+        with get_autocommit_engine().connect() as conn:
+            projects = conn.execute(_LIST_PROJECTS_STMT).all()
 
         if not projects:
             return "No projects registered. Use add_or_update_project to add one."
 
         lines = ["📚 **Registered Projects:**"]
-        for p in projects:
-            active_mark = "🌟 [ACTIVE]" if p.is_active else "  "
-            lines.append(f"{active_mark} **{p.name}** -> `{p.absolute_path}`")
-            if p.git_remote:
-                lines.append(f"     Git: {p.git_remote}")
-
+        lines.extend(_format_project(p) for p in projects)
         return "\n".join(lines)
 
     except Exception as e:
         logger.error(f"Error listing projects: {e}")
         return f"❌ Database error: {str(e)}"
-    finally:
-        session.close()
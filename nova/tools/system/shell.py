@@ -1,5 +1,6 @@
 import subprocess
 import asyncio
+import concurrent.futures
 import os
 import logging
 from typing import Optional
@@ -12,62 +13,151 @@ from nova.tools.core.context_optimizer import wrap_tool_output_optimization
 
 logger = logging.getLogger(__name__)
 
+# Threads that run the streaming shell coroutine for calls made from inside a
+# running event loop; reused across calls instead of a new pool per command.
+_SHELL_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="nova-shell"
+)
+
+# Longest single output line the stream readers will buffer
+_STREAM_LINE_LIMIT = 1024 * 1024
+
+# Streamed lines are batched into one Telegram message per flush: whichever
+# comes first of the interval, the line count, or the size (Telegram caps a
+# message at 4096 chars, leave room for the header).
+_STREAM_FLUSH_INTERVAL = 0.5
+_STREAM_FLUSH_LINES = 50
+_STREAM_FLUSH_CHARS = 3500
+
+
+async def _iter_lines(stream: asyncio.StreamReader):
+    """
+    Yield the raw lines of a process pipe. A line longer than the stream limit
+    comes out in limit-sized pieces instead of raising and losing the buffer.
+    """
+    split = False
+    while True:
+        try:
+            raw = await stream.readuntil(b"\n")
+        except asyncio.IncompleteReadError as e:  # EOF
+            if e.partial:
+                yield e.partial
+            return
+        except asyncio.LimitOverrunError as e:
+            split = True
+            yield await stream.read(e.consumed)
+            continue
+        # The newline that ended a split line is not a blank line of its own
+        if not (split and raw == b"\n"):
+            yield raw
+        split = False
+
+
+async def _pump_lines(
+    stream: asyncio.StreamReader,
+    label: str,
+    lines: list,
+    queue: Optional[asyncio.Queue],
+    keep_blank: bool,
+) -> None:
+    """
+    Collect lines from a process pipe and queue the non-blank ones for
+    streaming. stdout lines (keep_blank) lose only trailing whitespace, the
+    others are stripped on both sides.
+    """
+    async for raw in _iter_lines(stream):
+        line = raw.decode(errors="replace")
+        line = line.rstrip() if keep_blank else line.strip()
+        if not line.strip():
+            if keep_blank:
+                lines.append(line)
+            continue
+        lines.append(line)
+        if queue is not None:
+            queue.put_nowait(f"[{label}] {line}")
+
+
+async def _send_batches(queue: asyncio.Queue, chat_id: str, subagent_name: str) -> None:
+    """Send queued output lines via SAU in batches until a None sentinel arrives."""
+    loop = asyncio.get_running_loop()
+    batch = []
+    size = 0
+    deadline = 0.0
+
+    async def flush():
+        nonlocal size
+        if batch:
+            await send_streaming_progress(
+                chat_id=chat_id, name=subagent_name, progress="\n".join(batch)
+            )
+            batch.clear()
+            size = 0
+
+    while True:
+        try:
+            if batch:
+                line = await asyncio.wait_for(
+                    queue.get(), max(0.0, deadline - loop.time())
+                )
+            else:
+                line = await queue.get()
+        except asyncio.TimeoutError:
+            await flush()
+            continue
+
+        if line is None:
+            await flush()
+            return
+
+        if batch and size + len(line) > _STREAM_FLUSH_CHARS:
+            await flush()
+        if not batch:
+            deadline = loop.time() + _STREAM_FLUSH_INTERVAL
+        batch.append(line)
+        size += len(line) + 1
+        if len(batch) >= _STREAM_FLUSH_LINES:
+            await flush()
+
 
 async def _stream_shell_output(
     command: str, chat_id: Optional[str] = None, subagent_name: str = "Shell"
 ) -> str:
     """
-    Execute a shell command and stream each line of output as a separate Telegram message.
-    This provides real-time feedback to the user.
+    Execute a shell command and stream its output to Telegram in small batches.
+    This provides near real-time feedback to the user.
     """
     if chat_id is None:
         chat_id = os.getenv("DEFAULT_TELEGRAM_CHAT_ID")
 
     try:
-        # Run command in a restricted environment
-        process = subprocess.Popen(
+        process = await asyncio.create_subprocess_shell(
             command,
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,  # Line buffered
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=_STREAM_LINE_LIMIT,
         )
 
         stdout_lines = []
         stderr_lines = []
 
-        # Read stdout line by line and stream each
-        for line in iter(process.stdout.readline, ""):
-            if line:
-                line = line.rstrip()
-                stdout_lines.append(line)
-                # Send each line immediately via SAU
-                if chat_id and line.strip():
-                    await send_streaming_progress(
-                        chat_id=chat_id, name=subagent_name, progress=f"[stdout] {line}"
-                    )
-
-        process.stdout.close()
-        process.wait()
-
-        # Read any remaining stderr
-        stderr_output = process.stderr.read()
-        if stderr_output:
-            for line in stderr_output.splitlines():
-                line = line.strip()
-                if line:
-                    stderr_lines.append(line)
-                    if chat_id and line:
-                        await send_streaming_progress(
-                            chat_id=chat_id,
-                            name=subagent_name,
-                            progress=f"[stderr] {line}",
-                        )
-
-        process.stderr.close()
-
-        returncode = process.returncode
+        queue = asyncio.Queue() if chat_id else None
+        sender = (
+            asyncio.create_task(_send_batches(queue, chat_id, subagent_name))
+            if queue is not None
+            else None
+        )
+
+        # Drain both pipes concurrently so neither can fill up and block
+        try:
+            await asyncio.gather(
+                _pump_lines(process.stdout, "stdout", stdout_lines, queue, True),
+                _pump_lines(process.stderr, "stderr", stderr_lines, queue, False),
+            )
+            returncode = await process.wait()
+        finally:
+            if sender is not None:
+                queue.put_nowait(None)
+                await sender
 
         if returncode == 0:
             result = "\n".join(stdout_lines)
@@ -102,20 +192,18 @@ def execute_shell_command(
     """
     # Check if we're in an async context that can use streaming
     try:
-        loop = asyncio.get_running_loop()
-        # We have an event loop - try async execution
-        # Create a task and run it synchronously (blocking wait)
-        import concurrent.futures
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(
-                asyncio.run, _stream_shell_output(command, chat_id, subagent_name)
-            )
-            return future.result()
+        asyncio.get_running_loop()
     except RuntimeError:
         # No event loop - use sync version
         return _execute_shell_command_sync(command)
 
+    # We have an event loop - run the streaming version on a pool thread
+    # with its own loop and wait for it (blocking wait)
+    future = _SHELL_EXECUTOR.submit(
+        asyncio.run, _stream_shell_output(command, chat_id, subagent_name)
+    )
+    return future.result()
+
 
 def _execute_shell_command_sync(command: str) -> str:
     """Synchronous shell execution for when async is not available."""
@@ -0,0 +1,27 @@
+"""Shared test fixtures."""
+
+import os
+import shutil
+import tempfile
+
+import pytest
+
+# Every suite shares one throwaway SQLite file, set before any test module
+# imports nova and caches an engine. Suites clear tables, never the file.
+_DB_DIR = tempfile.mkdtemp(prefix="nova-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_DB_DIR, 'nova.db')}"
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(_DB_DIR, ignore_errors=True)
+
+
+@pytest.fixture
+def db_engine():
+    """The shared database engine, with every imported model's table created."""
+    from nova.db.base import Base
+    from nova.db.engine import get_db_engine
+
+    engine = get_db_engine()
+    Base.metadata.create_all(engine)
+    return engine
@@ -1,5 +1,4 @@
 import pytest
-import os
 from unittest.mock import patch, MagicMock
 from nova.tools.mcp.mcp_registry import mcp_registry
 from nova.tools.core.specialist_registry import (
@@ -12,14 +11,10 @@ from nova.agent import get_agent
 
 @pytest.fixture
 def clean_db():
-    # Use a test sqlite DB for tests
-    os.environ["DATABASE_URL"] = "sqlite:///test_nova.db"
+    # Runs against the shared test database set up in conftest
     from migrations.migrate import run_migrations
 
     run_migrations()
-    yield
-    if os.path.exists("test_nova.db"):
-        os.remove("test_nova.db")
 
 
 def test_mcp_registry(clean_db):
@@ -8,8 +8,8 @@ import time
 import os
 import sys
 
-# Set test environment
-os.environ["DATABASE_URL"] = "sqlite:///test_deployment.db"
+# Set test environment (under pytest, conftest has already chosen the database)
+os.environ.setdefault("DATABASE_URL", "sqlite:///test_deployment.db")
 
 from nova.db.engine import get_db_engine
 from nova.db.base import Base
@@ -203,6 +203,20 @@ class TestTaskTracker(unittest.TestCase):
         success = self.tt.update_heartbeat("test-task-4")
         self.assertTrue(success)
 
+    def test_heartbeats_are_flushed_in_batch(self):
+        """Buffered heartbeats are persisted together by flush_heartbeats."""
+        for i in range(3):
+            self.tt.register_task(
+                task_id=f"hb-task-{i}", task_type="test", subagent_name="TestAgent"
+            )
+            self.tt.update_heartbeat(f"hb-task-{i}")
+
+        # Unknown ids are buffered too; the flush finds they have no row
+        self.assertTrue(self.tt.update_heartbeat("missing-task"))
+        self.assertEqual(self.tt.flush_heartbeats(), 3)
+        self.assertEqual(self.tt.flush_heartbeats(), 0)
+        self.assertFalse(self.tt.update_heartbeat("missing-task"))
+
     def test_update_progress(self):
         """Test progress update."""
         self.tt.register_task(
@@ -0,0 +1,39 @@
+"""Tests for the MCP server registry."""
+
+import uuid
+import pytest
+
+from nova.tools.mcp.mcp_registry import MCPRegistry
+
+
+@pytest.fixture
+def registry(db_engine):
+    return MCPRegistry()
+
+
+def _name() -> str:
+    return f"test-mcp-{uuid.uuid4().hex[:8]}"
+
+
+def test_register_upserts(registry):
+    name = _name()
+
+    registry.register_server(name, command="old")
+    assert "successfully" in registry.register_server(name, command="new")
+
+    rows = [s for s in registry.list_servers() if s["name"] == name]
+    assert [s["command"] for s in rows] == ["new"]
+
+    registry.remove_server(name)
+
+
+def test_remove_sees_servers_registered_elsewhere(registry):
+    name = _name()
+    registry.list_servers()
+
+    # Registered by another process after this one listed the servers
+    MCPRegistry().register_server(name, command="x")
+
+    assert registry.remove_server(name) == f"MCP Server '{name}' removed."
+    assert name not in [s["name"] for s in registry.list_servers()]
+    assert registry.remove_server(name) == f"MCP Server '{name}' not found."
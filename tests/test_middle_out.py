@@ -15,6 +15,7 @@ for mod_name in list(sys.modules.keys()):
     if "nova" in mod_name:
         del sys.modules[mod_name]
 
+from nova.tools.core import prompt_transformer
 from nova.tools.core.prompt_transformer import (
     MiddleOutTransformer,
     TransformResult,
@@ -77,6 +78,91 @@ def test_preserves_sections():
     print("PASS: test_preserves_sections")
 
 
+def test_extract_latest_message_uses_last_turn():
+    """The latest message is taken from the final Human/User turn."""
+    transformer = MiddleOutTransformer(max_tokens=5000)
+
+    prompt = (
+        "System."
+        + "s" * 200
+        + "\nUser: first question"
+        + "h" * 300
+        + "\n\nhuman: final question"
+    )
+    latest, history = transformer.extract_latest_message(prompt)
+    system, rest = transformer.extract_system_prompt(prompt)
+
+    assert latest.endswith("final question")
+    assert history == prompt
+    assert system == "System." + "s" * 200
+    assert rest.startswith("\nUser: first question")
+
+    print("PASS: test_extract_latest_message_uses_last_turn")
+
+
+def test_extract_system_prompt_prefers_human_marker():
+    """A Human: turn ends the system prompt even after an earlier User: turn."""
+    transformer = MiddleOutTransformer(max_tokens=5000)
+
+    prompt = (
+        "System."
+        + "s" * 200
+        + "\nUser: quoted example"
+        + "e" * 200
+        + "\n\nHuman: real question"
+        + "q" * 200
+    )
+    system, rest = transformer.extract_system_prompt(prompt)
+
+    assert system.endswith("e" * 200)
+    assert rest.startswith("\n\nHuman: real question")
+
+    print("PASS: test_extract_system_prompt_prefers_human_marker")
+
+
+def test_repeated_prompt_reuses_result():
+    """An identical oversized prompt is only transformed once."""
+    transformer = MiddleOutTransformer(max_tokens=1000)
+
+    prompt = "System prompt. " * 50 + "\nUser: hello" + "x" * 10000
+    first = transformer.transform(prompt)
+    half = len(prompt) // 2
+    second = transformer.transform(prompt[:half] + prompt[half:])
+
+    assert first.was_transformed
+    assert second is first
+
+    transformer.max_chars = 5000
+    third = transformer.transform(prompt)
+    assert third is not first
+
+    print("PASS: test_repeated_prompt_reuses_result")
+
+
+def test_transform_cache_is_bounded_by_size():
+    """Cached prompts are matched exactly and evicted past the size budget."""
+    transformer = MiddleOutTransformer(max_tokens=1000)
+    prompts = ["System prompt. " * 50 + "\nUser: hello" + c * 10000 for c in "abc"]
+
+    saved = prompt_transformer.TRANSFORM_CACHE_MAX_CHARS
+    prompt_transformer.TRANSFORM_CACHE_MAX_CHARS = 2 * len(prompts[0]) + 10000
+    try:
+        results = [transformer.transform(p) for p in prompts]
+    finally:
+        prompt_transformer.TRANSFORM_CACHE_MAX_CHARS = saved
+
+    # Same-length prompts each get their own result
+    for c, result in zip("abc", results):
+        assert result.transformed_prompt.endswith(c * 10)
+
+    # Only the two most recent fit in the budget
+    assert transformer._cached_chars <= 2 * len(prompts[0]) + 10000
+    assert transformer.transform(prompts[0]) is not results[0]
+    assert transformer.transform(prompts[2]) is results[2]
+
+    print("PASS: test_transform_cache_is_bounded_by_size")
+
+
 def test_extreme_case():
     """Extremely large prompts should still be handled."""
     transformer = MiddleOutTransformer(max_tokens=10000)
@@ -151,6 +237,9 @@ def main():
         test_no_truncation_needed,
         test_middle_out_transformation,
         test_preserves_sections,
+        test_extract_latest_message_uses_last_turn,
+        test_repeated_prompt_reuses_result,
+        test_transform_cache_is_bounded_by_size,
         test_extreme_case,
         test_mock_large_prompt,
         test_200k_token_scenario,
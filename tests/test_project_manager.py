@@ -0,0 +1,69 @@
+"""Tests for the project manager tools."""
+
+import uuid
+import pytest
+from sqlalchemy import event, select
+
+from nova.db.deployment_models import ProjectContext
+from nova.db.engine import get_db_engine, get_session_factory
+from nova.tools.system import project_manager
+
+
+def _unwrap(tool):
+    return getattr(tool, "__wrapped__", tool)
+
+
+add_or_update_project = _unwrap(project_manager.add_or_update_project)
+set_active_project = _unwrap(project_manager.set_active_project)
+
+
+@pytest.fixture
+def project_names(db_engine):
+    """Two fresh project names, removed again afterwards."""
+    names = [f"test-project-{uuid.uuid4().hex[:8]}" for _ in range(2)]
+
+    yield names
+
+    with get_session_factory().begin() as session:
+        session.query(ProjectContext).filter(ProjectContext.name.in_(names)).delete()
+
+
+def test_add_or_update_reports_new_then_updated(project_names, tmp_path):
+    name = project_names[0]
+
+    assert "Added new project" in add_or_update_project(name, str(tmp_path))
+    assert "Updated existing project" in add_or_update_project(
+        name, str(tmp_path), "git@example.com:x.git"
+    )
+
+    with get_session_factory()() as session:
+        project = session.scalars(
+            select(ProjectContext).where(ProjectContext.name == name)
+        ).one()
+    assert project.git_remote == "git@example.com:x.git"
+
+
+def test_set_active_project_is_one_update(project_names, tmp_path):
+    for name in project_names:
+        add_or_update_project(name, str(tmp_path))
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = get_db_engine()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        result = set_active_project(project_names[1])
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert "Successfully set active project" in result
+    assert [s.split()[0] for s in statements] == ["UPDATE"]
+
+    with get_session_factory()() as session:
+        active = session.scalars(
+            select(ProjectContext.name).where(ProjectContext.is_active)
+        ).all()
+    assert active == [project_names[1]]
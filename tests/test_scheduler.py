@@ -0,0 +1,266 @@
+"""Tests for scheduled task jobs."""
+
+import asyncio
+import os
+import uuid
+import pytest
+from unittest.mock import AsyncMock, patch
+from sqlalchemy import event, update
+
+from nova.db.engine import get_async_autocommit_engine, get_db_engine
+from nova.tools.scheduler import scheduler
+from nova.tools.scheduler.scheduler import (
+    ScheduledTask,
+    TaskStatus,
+    add_scheduled_task,
+    get_scheduler,
+    get_session,
+)
+
+
+@pytest.fixture
+def shell_task(db_engine):
+    """A running standalone_sh task with notifications on."""
+    name = f"test-task-{uuid.uuid4().hex[:8]}"
+    result = add_scheduled_task(
+        name, "0 9 * * *", "standalone_sh", script_path="true", run_immediately=False
+    )
+    assert result.startswith("[OK]"), result
+
+    db = get_session()
+    try:
+        task_id = (
+            db.query(ScheduledTask.id).filter(ScheduledTask.task_name == name).scalar()
+        )
+    finally:
+        db.close()
+
+    yield task_id
+
+    scheduler.remove_scheduled_task(name)
+
+
+async def _fire(task_id: int) -> AsyncMock:
+    """Run the task's stored job and return the mocked shell executor."""
+    job = get_scheduler().get_job(str(task_id))
+    assert job is not None
+    executor = AsyncMock(return_value=("success", "ok"))
+    with patch.object(scheduler, "_execute_standalone_shell", executor):
+        await scheduler._job_executor(*job.args, **job.kwargs)
+    return executor
+
+
+@pytest.mark.asyncio
+async def test_toggle_notify_reaches_scheduled_job(shell_task):
+    from nova.telegram_bot import _toggle_task_notifications
+
+    # Paused: jobs go through the real jobstore but never fire on their own
+    get_scheduler().start(paused=True)
+    try:
+        executor = await _fire(shell_task)
+        assert executor.call_args[0][2] is True
+
+        query = AsyncMock()
+        with patch("nova.telegram_bot._show_task_detail", new_callable=AsyncMock):
+            await _toggle_task_notifications(query, shell_task)
+        query.answer.assert_called_once_with("Notifications Off")
+
+        executor = await _fire(shell_task)
+        assert executor.call_args[0][2] is False
+    finally:
+        get_scheduler().shutdown(wait=False)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "script",
+    [
+        "import sys\nprint(repr(sys.stdin.read()))",
+        "#lang: sh\ncat; echo done",
+    ],
+)
+async def test_inline_script_does_not_read_its_source_on_stdin(script):
+    status, output = await scheduler._execute_inline_script(1, script, False)
+    assert status == "success", output
+    assert output in ("''", "done")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "script, expected",
+    [
+        # Over Linux's 128 KB limit on a single argv string
+        ("x = '" + "a" * 200_000 + "'\nprint(len(x))", "200000"),
+        ("#lang: sh\n# " + "a" * 200_000 + "\necho ok", "ok"),
+    ],
+    ids=["python", "sh"],
+)
+async def test_inline_script_runs_large_bodies(script, expected):
+    status, output = await scheduler._execute_inline_script(1, script, False)
+    assert status == "success", output
+    assert output == expected
+
+
+@pytest.mark.asyncio
+async def test_inline_script_runs_from_a_temp_file_that_is_removed():
+    script = "import os\nprint(os.path.isfile(__file__), __file__)"
+    status, output = await scheduler._execute_inline_script(1, script, False)
+    assert status == "success", output
+    exists, path = output.split(" ", 1)
+    assert exists == "True" and path.endswith(".py")
+    assert not os.path.exists(path)
+
+
+@pytest.mark.asyncio
+async def test_watcher_trigger_after_output_cap():
+    filler = "x" * (2 * scheduler.OUTPUT_CAPTURE_BYTES)
+    script = f"print({filler!r})\nprint('__NOVA_TRIGGER__ disk almost full')"
+    reinvigorate = AsyncMock()
+    with patch.object(scheduler, "_load_reinvigorate_nova", return_value=reinvigorate):
+        status, output = await scheduler._execute_watcher_task(1, script, "42")
+        await asyncio.sleep(0)
+
+    assert (status, output) == ("success", "Triggered: disk almost full")
+    reinvigorate.assert_awaited_once()
+    assert reinvigorate.await_args[0][1].endswith("\ndisk almost full")
+
+
+@pytest.mark.asyncio
+async def test_read_capped_finds_marker_split_across_reads():
+    marker = scheduler.WATCHER_TRIGGER_MARKER.encode()
+    stream = asyncio.StreamReader()
+    # The first 64 KiB read ends halfway through the marker
+    stream.feed_data(b"x" * (65536 - 8) + marker + b" payload")
+    stream.feed_eof()
+
+    data = await scheduler._read_capped(stream, 20, marker)
+    assert data == (marker + b" payload")[:20]
+
+
+@pytest.mark.asyncio
+async def test_flush_sends_queued_notifications(monkeypatch):
+    monkeypatch.setattr(scheduler, "_TG_TOKEN", "token")
+    post = AsyncMock()
+    monkeypatch.setattr(scheduler, "_post_telegram_message", post)
+
+    for message in ("one", "two"):
+        await scheduler._send_telegram_notification(message, chat_id="42")
+    await scheduler.flush_telegram_notifications()
+
+    post.assert_awaited_once()
+    assert post.await_args[0][1:] == ("42", "one\n---\ntwo")
+    assert scheduler._tg_worker_task is None
+
+
+@pytest.mark.asyncio
+async def test_flush_logs_notifications_it_could_not_send(monkeypatch, caplog):
+    async def never_sent(*args):
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(scheduler, "_TG_TOKEN", "token")
+    monkeypatch.setattr(scheduler, "_post_telegram_message", never_sent)
+
+    await scheduler._send_telegram_notification("stuck", chat_id="42")
+    await scheduler.flush_telegram_notifications(timeout=0.05)
+
+    assert "dropped 1 queued notifications" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_sync_round_trips_stored_jobs_and_drops_orphans(shell_task):
+    sched = get_scheduler()
+    sched.start(paused=True)
+    try:
+        # A stale job for the task (a task_snapshot from an earlier version)
+        # and one with no task
+        sched.add_job(
+            scheduler.JOB_EXECUTOR_REF,
+            trigger="cron",
+            id=str(shell_task),
+            args=[shell_task],
+            kwargs={"task_snapshot": {}},
+            replace_existing=True,
+        )
+        sched.add_job(
+            scheduler.JOB_EXECUTOR_REF, trigger="cron", id="orphan-job", args=[0]
+        )
+
+        removed, *_ = scheduler._sync_jobs(sched, refresh=True)
+        assert removed >= 1
+
+        # Rows written by _store_jobs load back through the real jobstore
+        stored = {job.id: job for job in scheduler._jobstore.get_all_jobs()}
+        assert "orphan-job" not in stored
+        job = stored[str(shell_task)]
+        assert job.next_run_time is not None
+        task = next(t for t in scheduler._sync_jobs(sched)[2] if t.id == shell_task)
+        assert scheduler._job_is_current(job, task)
+    finally:
+        sched.shutdown(wait=False)
+
+
+@pytest.mark.asyncio
+async def test_job_fire_is_one_select_and_one_update(shell_task):
+    engine = get_async_autocommit_engine().sync_engine
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        executor = AsyncMock(return_value=("success", "ok"))
+        with patch.object(scheduler, "_execute_standalone_shell", executor):
+            # Jobs stored by earlier versions still pass a task_snapshot
+            await scheduler._job_executor(shell_task, task_snapshot={})
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    executor.assert_awaited_once()
+    assert [s.split()[0] for s in statements] == ["SELECT", "UPDATE"]
+
+
+@pytest.mark.asyncio
+async def test_job_skips_task_paused_in_db(shell_task):
+    # Paused by another process: _paused_ids is stale
+    with get_db_engine().begin() as conn:
+        conn.execute(
+            update(ScheduledTask)
+            .where(ScheduledTask.id == shell_task)
+            .values(status=TaskStatus.PAUSED)
+        )
+    assert shell_task not in scheduler._paused_ids
+
+    executor = await _fire(shell_task)
+    executor.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_status_lists_jobs_from_the_jobstore(shell_task, monkeypatch):
+    get_status = getattr(
+        scheduler.get_scheduler_status, "__wrapped__", scheduler.get_scheduler_status
+    )
+    assert get_status() == "Scheduler: Stopped"
+
+    sched = get_scheduler()
+    sched.start(paused=True)
+    try:
+        sched.add_job(
+            scheduler.JOB_EXECUTOR_REF,
+            trigger="cron",
+            id=f"manual_{shell_task}",
+            args=[shell_task],
+        )
+        scheduler._sync_jobs(sched, refresh=True)
+        job_count = len(sched.get_jobs())
+
+        monkeypatch.setattr(scheduler, "STATUS_MAX_JOBS", 1)
+        lines = get_status().splitlines()
+    finally:
+        sched.shutdown(wait=False)
+
+    assert lines[:2] == ["Scheduler: Running", f"Active Jobs: {job_count}"]
+    # Only STATUS_MAX_JOBS jobs are listed, each with a real run time
+    listed = [line for line in lines if line.startswith("  - ")]
+    assert len(listed) == 1 and "next run at None" not in listed[0]
+    assert lines[-1] == f"  ... and {job_count - 1} more"
@@ -0,0 +1,65 @@
+"""Tests for streamed shell output."""
+
+import asyncio
+import pytest
+
+from nova.tools.system import shell
+
+
+def _reader(data: bytes, limit: int) -> asyncio.StreamReader:
+    stream = asyncio.StreamReader(limit=limit)
+    stream.feed_data(data)
+    stream.feed_eof()
+    return stream
+
+
+@pytest.mark.asyncio
+async def test_long_line_is_split_not_dropped():
+    long_line = b"x" * 100
+    stream = _reader(b"first\n" + long_line + b"\nlast", limit=16)
+
+    lines = []
+    await shell._pump_lines(stream, "stdout", lines, None, True)
+
+    assert lines[0] == "first"
+    assert "".join(lines[1:-1]) == long_line.decode()
+    assert lines[-1] == "last"
+    assert "" not in lines
+
+
+@pytest.mark.asyncio
+async def test_stderr_lines_are_stripped():
+    stream = _reader(b"  warning: x  \n\n\terror\n", limit=1024)
+    queue = asyncio.Queue()
+
+    lines = []
+    await shell._pump_lines(stream, "stderr", lines, queue, False)
+
+    assert lines == ["warning: x", "error"]
+    assert queue.get_nowait() == "[stderr] warning: x"
+
+
+@pytest.mark.asyncio
+async def test_output_lines_are_sent_in_batches(monkeypatch):
+    sent = []
+
+    async def fake_send(chat_id, name, progress):
+        sent.append(progress)
+
+    monkeypatch.setattr(shell, "send_streaming_progress", fake_send)
+
+    queue = asyncio.Queue()
+    for i in range(120):
+        queue.put_nowait(f"[stdout] line {i}")
+    queue.put_nowait("[stdout] " + "y" * shell._STREAM_FLUSH_CHARS)
+    queue.put_nowait(None)
+
+    await shell._send_batches(queue, "123", "Shell")
+
+    # 120 short lines fill batches of _STREAM_FLUSH_LINES; the long line
+    # goes out on its own rather than overflowing the last batch
+    batches = [batch.split("\n") for batch in sent]
+    assert [len(b) for b in batches] == [50, 50, 20, 1]
+    assert [line for b in batches[:3] for line in b] == [
+        f"[stdout] line {i}" for i in range(120)
+    ]
@@ -1,6 +1,8 @@
 import unittest
+import pytest
 from nova.tools.core.specialist_registry import save_specialist_config, get_specialist_config, list_specialists
 
+@pytest.mark.usefixtures("db_engine")
 class TestSpecialistRegistry(unittest.TestCase):
 
     def test_save_specialist_config(self):
@@ -22,5 +24,30 @@ class TestSpecialistRegistry(unittest.TestCase):
         result = list_specialists()
         self.assertNotEqual(result, "No specialists registered.")
 
+    def test_seed_reports_new_and_updated(self):
+        from nova.tools.core.specialist_registry import (
+            DEFAULT_SPECIALISTS,
+            SpecialistConfig,
+            _get_session,
+            seed_default_specialists,
+        )
+
+        seed_default_specialists()
+        first, second = DEFAULT_SPECIALISTS[0]["name"], DEFAULT_SPECIALISTS[1]["name"]
+        session = _get_session()
+        try:
+            session.query(SpecialistConfig).filter(SpecialistConfig.name == first).delete()
+            session.query(SpecialistConfig).filter(SpecialistConfig.name == second).update({"model": ""})
+            session.commit()
+        finally:
+            session.close()
+
+        result = seed_default_specialists()
+        names = result.split(": ", 1)[1].split(", ")
+        self.assertEqual(names[0], first)
+        self.assertEqual(names[1], f"{second} (updated)")
+        # An empty model counts as unset and gets the default
+        self.assertTrue(get_specialist_config(second)["model"])
+
 if __name__ == '__main__':
     unittest.main()